@@ -6,6 +6,8 @@ Launches the professional video editing interface
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 
 # Ensure we're in the right directory
@@ -14,35 +16,27 @@ os.chdir(Path(__file__).parent)
 # Add the project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Required packages as (module name, pip name)
+REQUIRED_MODULES = (
+    ("customtkinter", "customtkinter"),
+    ("moviepy", "moviepy"),
+    ("cv2", "opencv-python"),
+    ("tqdm", "tqdm"),
+)
+
 def check_dependencies():
-    """Check if required dependencies are installed"""
-    missing = []
+    """Check if required dependencies are installed (locates modules without importing them)"""
+    modules = [module for module, _ in REQUIRED_MODULES] + ["tkinterdnd2"]
     
-    try:
-        import customtkinter
-    except ImportError:
-        missing.append("customtkinter")
+    # Each probe walks sys.path on disk, so overlap them
+    with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+        found = dict(zip(modules, pool.map(find_spec, modules)))
         
-    try:
-        import tkinterdnd2
-    except ImportError:
+    missing = [pip_name for module, pip_name in REQUIRED_MODULES if found[module] is None]
+    
+    if found["tkinterdnd2"] is None:
         print("⚠️  tkinterdnd2 not installed - drag & drop will be disabled")
         
-    try:
-        from moviepy import VideoFileClip
-    except ImportError:
-        missing.append("moviepy")
-        
-    try:
-        import cv2
-    except ImportError:
-        missing.append("opencv-python")
-        
-    try:
-        from tqdm import tqdm
-    except ImportError:
-        missing.append("tqdm")
-        
     if missing:
         print("❌ Missing dependencies:")
         for dep in missing:
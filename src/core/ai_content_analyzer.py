@@ -7,42 +7,238 @@ Implements highlight detection, engagement scoring, and viral potential analysis
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterable, Iterator
 import torch
 import torch.nn as nn
-from torchvision import models, transforms
+from torchvision import models
 import librosa
 import speech_recognition as sr
 from moviepy import VideoFileClip
 from tqdm import tqdm
+import os
+import bisect
+import hashlib
+import heapq
+import itertools
+import queue
+import threading
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 import warnings
 warnings.filterwarnings('ignore')
 
+# Let OpenCV use its optimized kernels and parallel backend on all cores
+cv2.setUseOptimized(True)
+cv2.setNumThreads(os.cpu_count() or 1)
+
+# Optional frame decoders (faster than MoviePy's full-stream iteration)
+try:
+    import decord
+    DECORD_AVAILABLE = True
+except ImportError:
+    DECORD_AVAILABLE = False
+
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+# Optional batched CNN face detector
+try:
+    from batch_face import RetinaFace
+    RETINAFACE_AVAILABLE = True
+except ImportError:
+    RETINAFACE_AVAILABLE = False
+
+# Optional local speech recognition with word timestamps
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Optional TensorRT backend for the feature extractor
+try:
+    import torch_tensorrt
+    TENSORRT_AVAILABLE = True
+except ImportError:
+    TENSORRT_AVAILABLE = False
+
+# Optional fast hashing for the analysis cache key
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional INT8 inference through ONNX Runtime
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, quantize_static
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# Optional JIT for the CPU frame statistics (compiled kernels cached across runs)
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Numba picks the cache location when the kernel is decorated; set it in Numba's
+    # own config (not the environment, which ffmpeg and worker processes inherit)
+    # unless the user chose one with NUMBA_CACHE_DIR
+    if not numba.config.CACHE_DIR:
+        numba.config.CACHE_DIR = str(Path.home() / '.cache' / 'ltw_clipper' / 'numba')
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _frame_stats_numba(frames):
+        """Grayscale frames plus HSV saturation/value variance in one pass over the pixels"""
+        n, h, w, _ = frames.shape
+        pixels = h * w
+        gray = np.empty((n, h, w), dtype=np.uint8)
+        sat_var = np.empty(n, dtype=np.float64)
+        val_var = np.empty(n, dtype=np.float64)
+
+        for f in prange(n):
+            sat_sum = 0.0
+            sat_sq = 0.0
+            val_sum = 0.0
+            val_sq = 0.0
+            for y in range(h):
+                for x in range(w):
+                    r = np.float32(frames[f, y, x, 0])
+                    g = np.float32(frames[f, y, x, 1])
+                    b = np.float32(frames[f, y, x, 2])
+                    gray[f, y, x] = np.uint8(0.299 * r + 0.587 * g + 0.114 * b + 0.5)
+
+                    value = max(r, g, b)
+                    low = min(r, g, b)
+                    sat = 255.0 * (value - low) / value if value > 0 else 0.0
+
+                    sat_sum += sat
+                    sat_sq += sat * sat
+                    val_sum += value
+                    val_sq += value * value
+
+            sat_mean = sat_sum / pixels
+            val_mean = val_sum / pixels
+            sat_var[f] = sat_sq / pixels - sat_mean * sat_mean
+            val_var[f] = val_sq / pixels - val_mean * val_mean
+
+        return gray, sat_var, val_var
+
+
+if ONNXRUNTIME_AVAILABLE:
+    class _FrameCalibrationReader(CalibrationDataReader):
+        """Feeds preprocessed frames to ONNX Runtime static quantization"""
+
+        def __init__(self, input_name: str, batch: np.ndarray):
+            self._inputs = iter([{input_name: batch[i:i + 1]} for i in range(len(batch))])
+
+        def get_next(self):
+            return next(self._inputs, None)
+
+
+def _prefetch(iterable: Iterable, depth: int) -> Iterator:
+    """Consume an iterable on a background thread, keeping at most `depth` items buffered"""
+    buffer = queue.Queue(maxsize=depth)
+    done = object()
+
+    def produce():
+        try:
+            for item in iterable:
+                buffer.put((item, None))
+        except Exception as e:
+            buffer.put((None, e))
+        buffer.put((done, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    while True:
+        item, error = buffer.get()
+        if error is not None:
+            raise error
+        if item is done:
+            return
+        yield item
+
 
 class HighlightDetector:
     """
     Detects highlight moments in videos using computer vision and audio analysis
     """
 
-    def __init__(self, device: str = 'auto'):
+    # ResNet input settings (ImageNet normalization used by the torchvision weights)
+    FEATURE_INPUT_SIZE = 224
+    FEATURE_BATCH_SIZE = 32
+    PREFETCH_BATCHES = 4  # Decoded batches buffered ahead of feature extraction
+    SEEK_MIN_GAP = 300  # Seek rather than grab() when samples are further apart (frames)
+    IMAGENET_MEAN = (0.485, 0.456, 0.406)
+    IMAGENET_STD = (0.229, 0.224, 0.225)
+    INT8_MODEL_PATH = Path.home() / '.cache' / 'ltw_clipper' / 'resnet50_int8_fixedcal.onnx'
+    INT8_CALIBRATION_FRAMES = 64  # Size of the fixed calibration set (see _int8_calibration_frames)
+
+    # Frame feature settings
+    FLOW_WIDTH = 320  # Optical flow runs on a downscaled frame
+    FLOW_NORM = 8.0  # Mean flow magnitude (pixels at FLOW_WIDTH) treated as full motion
+    FACE_DETECT_WIDTH = 640  # Haar cost scales with pixel count; ratios don't need 4K
+    DUPLICATE_HASH_DISTANCE = 5  # Max differing perceptual-hash bits for a repeated frame
+    DUPLICATE_MOTION_PENALTY = 0.8  # Motion carried onto a repeated frame is damped
+
+    def __init__(self, device: str = 'auto', use_tensorrt: bool = False, use_int8: bool = False):
         """
         Initialize the highlight detector
 
         Args:
             device: 'cpu', 'cuda', 'mps' (Mac M4), or 'auto'
+            use_tensorrt: Compile the feature extractor with TensorRT (CUDA only)
+            use_int8: Run the feature extractor as a statically quantized INT8 ONNX model
         """
         self.device = self._setup_device(device)
-
-        # Load pre-trained models
-        self.resnet_model = self._load_resnet_model()
-        self.transform = transforms.Compose([
-            transforms.ToPILImage(),
-            transforms.Resize((224, 224)),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
-        ])
+        self.use_tensorrt = use_tensorrt
+        self.use_int8 = use_int8 and ONNXRUNTIME_AVAILABLE
+        self._int8_session = None
+        if use_int8 and not ONNXRUNTIME_AVAILABLE:
+            print("⚠️ onnxruntime not installed, INT8 inference disabled")
+
+        # Half precision on GPUs, full precision on CPU
+        self._dtype = torch.float16 if self.device in ('cuda', 'mps') else torch.float32
+
+        # The ResNet feature extractor is loaded on first use (see resnet_model)
+
+        # Normalization constants shaped to broadcast over (B, 3, H, W) batches
+        self._mean = torch.tensor(self.IMAGENET_MEAN, device=self.device).view(1, 3, 1, 1)
+        self._std = torch.tensor(self.IMAGENET_STD, device=self.device).view(1, 3, 1, 1)
+
+        # Double-buffered pinned host memory and a copy stream (CUDA only, created on first use)
+        self._staging = None
+        self._staging_index = 0
+        self._copy_stream = None
+
+        # Face detectors, built once (RetinaFace when available, Haar as fallback)
+        self.face_detector = None
+        if RETINAFACE_AVAILABLE:
+            try:
+                self.face_detector = RetinaFace(gpu_id=0 if self.device == 'cuda' else -1,
+                                                fp16=self.device == 'cuda')
+            except Exception as e:
+                print(f"⚠️ RetinaFace unavailable, using Haar cascades: {e}")
+        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        self.cuda_face_cascade = self._load_cuda_cascade()
+
+        # Frame area shared by all frames of the video being analyzed
+        self._frame_area = None
+
+        # Dense optical flow for motion scoring (DIS is the fastest CPU option)
+        self._flow = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_ULTRAFAST)
 
         # Engagement scoring weights
         self.engagement_weights = {
@@ -53,6 +249,10 @@ class HighlightDetector:
             'text_presence': 0.1
         }
 
+        # Fixed-order weight vector so all frames are scored with one dot product
+        self._weight_keys = tuple(self.engagement_weights)
+        self._weights = np.array([self.engagement_weights[k] for k in self._weight_keys], dtype=np.float32)
+
     def _setup_device(self, device: str) -> str:
         """Setup the appropriate device for computation"""
         if device == 'auto':
@@ -64,14 +264,343 @@ class HighlightDetector:
                 return 'cpu'
         return device
 
-    def _load_resnet_model(self) -> nn.Module:
-        """Load pre-trained ResNet model for feature extraction"""
+    @cached_property
+    def resnet_model(self) -> nn.Module:
+        """ResNet feature extractor, downloaded and loaded on first use"""
+        return self._load_resnet_model()
+
+    def _build_resnet(self) -> nn.Module:
+        """Pre-trained FP32 ResNet50 without its classification layer"""
         model = models.resnet50(pretrained=True)
         model = nn.Sequential(*list(model.children())[:-1])  # Remove final classification layer
         model.eval()
+        return model
+
+    def _load_resnet_model(self) -> nn.Module:
+        """Load pre-trained ResNet model for feature extraction"""
+        model = self._build_resnet()
         model.to(self.device)
+
+        # Allow TF32 tensor cores for any remaining FP32 matmuls
+        torch.set_float32_matmul_precision('high')
+
+        if self._dtype == torch.float16:
+            model = model.half()
+
+        if self.use_tensorrt and self.device == 'cuda':
+            model = self._compile_tensorrt(model)
+
         return model
 
+    def _compile_tensorrt(self, model: nn.Module) -> nn.Module:
+        """Compile the feature extractor into an FP16 TensorRT engine"""
+        if not TENSORRT_AVAILABLE:
+            print("⚠️ torch_tensorrt not installed, using PyTorch inference")
+            return model
+
+        size = self.FEATURE_INPUT_SIZE
+        try:
+            return torch_tensorrt.compile(
+                model,
+                inputs=[torch_tensorrt.Input(
+                    min_shape=(1, 3, size, size),
+                    opt_shape=(self.FEATURE_BATCH_SIZE, 3, size, size),
+                    max_shape=(self.FEATURE_BATCH_SIZE, 3, size, size),
+                    dtype=torch.half
+                )],
+                enabled_precisions={torch.half}
+            )
+        except Exception as e:
+            print(f"⚠️ TensorRT compilation failed, using PyTorch inference: {e}")
+            return model
+
+    def _int8_calibration_frames(self) -> np.ndarray:
+        """
+        Build the fixed INT8 calibration set
+
+        Seeded, so every install quantizes against the same frames: smooth colour
+        layouts at varied exposure with varied grain, covering the brightness,
+        saturation and texture range of real footage without depending on
+        whichever video happens to be analyzed first.
+        """
+        rng = np.random.default_rng(0)
+        size = self.FEATURE_INPUT_SIZE
+        frames = np.empty((self.INT8_CALIBRATION_FRAMES, size, size, 3), dtype=np.uint8)
+        for i in range(len(frames)):
+            cells = int(rng.integers(2, 9))
+            layout = rng.integers(0, 256, (cells, cells, 3)).astype(np.float32)
+            frame = cv2.resize(layout, (size, size), interpolation=cv2.INTER_CUBIC)
+            frame = frame * rng.uniform(0.3, 1.2) + rng.normal(0, rng.uniform(0, 25), frame.shape)
+            frames[i] = np.clip(frame, 0, 255)
+        return frames
+
+    def _load_int8_session(self):
+        """
+        Create an ONNX Runtime session for the INT8 feature extractor
+
+        The model is exported and statically quantized (QDQ) once, calibrated
+        on the fixed calibration set, and cached on disk for every later video.
+        """
+        model_path = self.INT8_MODEL_PATH
+        if not model_path.exists():
+            print("🔧 Quantizing ResNet feature extractor to INT8...")
+            model_path.parent.mkdir(parents=True, exist_ok=True)
+            fp32_path = model_path.with_name('resnet50_fp32.onnx')
+            calibration = self._preprocess_numpy(self._int8_calibration_frames())
+            size = self.FEATURE_INPUT_SIZE
+
+            torch.onnx.export(
+                self._build_resnet(), torch.randn(1, 3, size, size), str(fp32_path),
+                opset_version=17, input_names=['input'], output_names=['features'],
+                dynamic_axes={'input': {0: 'batch'}, 'features': {0: 'batch'}}
+            )
+            quantize_static(str(fp32_path), str(model_path),
+                            _FrameCalibrationReader('input', calibration),
+                            quant_format=QuantFormat.QDQ)
+            fp32_path.unlink()
+
+        # TensorRT runs the QDQ graph in INT8; oneDNN VNNI kernels are used on CPU
+        available = ort.get_available_providers()
+        providers = []
+        if 'TensorrtExecutionProvider' in available:
+            providers.append(('TensorrtExecutionProvider', {'trt_int8_enable': True, 'trt_fp16_enable': True}))
+        providers += [p for p in ('CUDAExecutionProvider', 'CPUExecutionProvider') if p in available]
+
+        return ort.InferenceSession(str(model_path), providers=providers)
+
+    def _preprocess_numpy(self, resized: np.ndarray) -> np.ndarray:
+        """Normalize resized uint8 frames into a float32 NCHW batch"""
+        batch = resized.transpose(0, 3, 1, 2).astype(np.float32) / 255.0
+        mean = np.array(self.IMAGENET_MEAN, dtype=np.float32).reshape(1, 3, 1, 1)
+        std = np.array(self.IMAGENET_STD, dtype=np.float32).reshape(1, 3, 1, 1)
+        return (batch - mean) / std
+
+    def _staging_buffer(self, batch_size: int) -> torch.Tensor:
+        """
+        Get the next pinned uint8 staging buffer for one batch
+
+        Two buffers are used in turn so a batch can be staged while the
+        previous batch's copy is still in flight.
+        """
+        if self._staging is None:
+            size = self.FEATURE_INPUT_SIZE
+            self._staging = [
+                torch.empty((self.FEATURE_BATCH_SIZE, size, size, 3), dtype=torch.uint8, pin_memory=True)
+                for _ in range(2)
+            ]
+            self._copy_stream = torch.cuda.Stream()
+
+        self._staging_index ^= 1
+        return self._staging[self._staging_index][:batch_size]
+
+    def _launch_features(self, frames: np.ndarray) -> Any:
+        """
+        Queue ResNet inference for up to FEATURE_BATCH_SIZE frames
+
+        On CUDA this returns before the GPU has finished, so CPU work can
+        overlap with inference; pass the result to _collect_features.
+        """
+        size = self.FEATURE_INPUT_SIZE
+
+        # Resize on the CPU in uint8 so the device copy stays small
+        resized = np.stack([
+            cv2.resize(frame, (size, size), interpolation=cv2.INTER_AREA)
+            for frame in frames
+        ])
+
+        if self.use_int8:
+            if self._int8_session is None:
+                try:
+                    self._int8_session = self._load_int8_session()
+                except Exception as e:
+                    print(f"⚠️ INT8 quantization failed, using PyTorch inference: {e}")
+                    self.use_int8 = False
+
+            if self._int8_session is not None:
+                batch = self._preprocess_numpy(resized)
+                output = self._int8_session.run(None, {'input': batch})[0]
+                return output.reshape(len(resized), -1)
+
+        batch = torch.from_numpy(resized)
+
+        with torch.inference_mode():
+            if self.device == 'cuda':
+                staging = self._staging_buffer(len(resized))
+                staging.copy_(batch)
+
+                # Host-to-device copy on its own stream, compute waits for it
+                with torch.cuda.stream(self._copy_stream):
+                    batch = staging.to(self.device, non_blocking=True)
+                torch.cuda.current_stream().wait_stream(self._copy_stream)
+                batch.record_stream(torch.cuda.current_stream())
+            else:
+                batch = batch.to(self.device)
+
+            batch = batch.permute(0, 3, 1, 2).float().div_(255)
+            batch = batch.sub_(self._mean).div_(self._std).to(self._dtype)
+
+            output = self.resnet_model(batch).flatten(1).float()
+            if self.device == 'cuda':
+                output = output.to('cpu', non_blocking=True)
+
+        return output
+
+    def _collect_features(self, pending: Any) -> np.ndarray:
+        """Wait for a batch queued by _launch_features and return its (B, 2048) features"""
+        if isinstance(pending, np.ndarray):
+            return pending
+        if self.device == 'cuda':
+            torch.cuda.synchronize()
+        return pending.cpu().numpy()
+
+    def _calculate_visual_change(self, features: np.ndarray,
+                                 previous: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cosine distance between the ResNet features of consecutive frames
+
+        Args:
+            features: (N, 2048) features of a batch
+            previous: Features of the frame before the batch, if any
+        """
+        if previous is not None:
+            features = np.vstack([previous[None], features])
+
+        change = np.zeros(len(features), dtype=np.float32)
+        if len(features) >= 2:
+            norms = np.linalg.norm(features, axis=1, keepdims=True)
+            unit = features / np.maximum(norms, 1e-8)
+            similarity = np.einsum('ij,ij->i', unit[1:], unit[:-1])
+            change[1:] = np.clip(1.0 - similarity, 0.0, 1.0)
+
+        return change[1:] if previous is not None else change
+
+    def _iter_frame_batches(self, video_path: Path, video: VideoFileClip,
+                            frame_indices: np.ndarray, fps: float) -> Iterator[np.ndarray]:
+        """
+        Decode only the sampled frames of a video, in batches
+
+        Args:
+            video_path: Path to video file
+            video: Open clip, used when no faster decoder works
+            frame_indices: Indices of the frames to decode
+            fps: Frame rate of the video
+
+        Yields:
+            uint8 arrays of shape (B, H, W, 3), B <= FEATURE_BATCH_SIZE
+        """
+        frames = self._iter_sampled_frames(video_path, video, frame_indices, fps)
+        while True:
+            batch = list(itertools.islice(frames, self.FEATURE_BATCH_SIZE))
+            if not batch:
+                return
+            yield np.stack(batch)
+
+    def _iter_sampled_frames(self, video_path: Path, video: VideoFileClip,
+                             frame_indices: np.ndarray, fps: float) -> Iterator[np.ndarray]:
+        """
+        Yield sampled RGB frames from the fastest decoder that works
+
+        A decoder that fails, on open or partway through, hands the frames it
+        hasn't produced yet to the next one. MoviePy is the last resort; its
+        decode errors are fatal to the analysis.
+        """
+        decoders = []
+        if DECORD_AVAILABLE:
+            decoders.append(('decord', lambda indices: self._iter_frames_decord(video_path, indices)))
+        decoders.append(('OpenCV', lambda indices: self._iter_frames_opencv(video_path, indices)))
+        if PYAV_AVAILABLE:
+            decoders.append(('PyAV', lambda indices: self._iter_frames_pyav(video_path, indices, fps)))
+
+        decoded = 0
+        for name, decode in decoders:
+            try:
+                for frame in decode(frame_indices[decoded:]):
+                    yield frame
+                    decoded += 1
+                return
+            except Exception as e:
+                print(f"⚠️ {name} decode failed, falling back: {e}")
+
+        for i in frame_indices[decoded:]:
+            yield video.get_frame(i / fps)
+
+    def _iter_frames_decord(self, video_path: Path, frame_indices: np.ndarray) -> Iterator[np.ndarray]:
+        """Decode sampled frames with decord, using NVDEC when available"""
+        ctx = decord.cpu(0)
+        if self.device == 'cuda':
+            try:
+                ctx = decord.gpu(0)
+            except Exception:
+                pass
+
+        reader = decord.VideoReader(str(video_path), ctx=ctx)
+        frame_indices = frame_indices[frame_indices < len(reader)]
+
+        def frames():
+            for start in range(0, len(frame_indices), self.FEATURE_BATCH_SIZE):
+                chunk = frame_indices[start:start + self.FEATURE_BATCH_SIZE]
+                yield from reader.get_batch(chunk.tolist()).asnumpy()
+
+        return frames()
+
+    def _iter_frames_opencv(self, video_path: Path, frame_indices: np.ndarray) -> Iterator[np.ndarray]:
+        """
+        Decode sampled frames with OpenCV, using hardware decoding when available
+
+        Short gaps are skipped with grab() (decode without color conversion);
+        gaps longer than SEEK_MIN_GAP frames seek instead.
+        """
+        cap = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG,
+                               [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+        if not cap.isOpened():
+            raise IOError(f"Cannot open {video_path}")
+
+        def frames():
+            position = 0
+            try:
+                for index in frame_indices:
+                    index = int(index)
+                    if index - position > self.SEEK_MIN_GAP:
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+                        position = index
+                    while position < index:
+                        if not cap.grab():
+                            return
+                        position += 1
+
+                    ok, frame = cap.read()
+                    if not ok:
+                        return
+                    position += 1
+                    yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            finally:
+                cap.release()
+
+        return frames()
+
+    def _iter_frames_pyav(self, video_path: Path, frame_indices: np.ndarray, fps: float) -> Iterator[np.ndarray]:
+        """Decode with PyAV, converting only the sampled frames to RGB"""
+        container = av.open(str(video_path))
+        stream = container.streams.video[0]
+        stream.thread_type = 'AUTO'
+
+        def frames():
+            wanted = iter(frame_indices / fps)
+            next_time = next(wanted, None)
+            try:
+                for frame in container.decode(stream):
+                    if next_time is None:
+                        break
+                    if frame.time is None or frame.time + 0.5 / fps < next_time:
+                        continue
+
+                    yield frame.to_ndarray(format='rgb24')
+                    next_time = next(wanted, None)
+            finally:
+                container.close()
+
+        return frames()
+
     def analyze_video(self, video_path: Path, sample_rate: int = 1) -> Dict[str, Any]:
         """
         Analyze video for highlights and engagement potential
@@ -87,46 +616,56 @@ class HighlightDetector:
 
         # Load video
         video = VideoFileClip(str(video_path))
-        duration = video.duration
-        fps = video.fps
-
-        # Extract frames and audio
-        frames = []
-        timestamps = []
-        audio_energy = []
-
-        # Sample frames
-        frame_interval = int(fps / sample_rate) if sample_rate < fps else 1
-
-        for i, frame in enumerate(tqdm(video.iter_frames(fps=fps), desc="Extracting frames", unit="frame")):
-            if i % frame_interval == 0:
-                timestamp = i / fps
-                if timestamp <= duration:
-                    frames.append(frame)
-                    timestamps.append(timestamp)
-
-        # Extract audio features if available
-        if video.audio is not None:
-            audio_samples = video.audio.to_soundarray(fps=44100)
-            if len(audio_samples.shape) > 1:
-                audio_samples = audio_samples.mean(axis=1)  # Convert to mono
-
-            # Calculate audio energy in windows
-            window_size = int(44100 * (1 / sample_rate))  # 1 second windows
-            for i in range(0, len(audio_samples), window_size):
-                window = audio_samples[i:i+window_size]
-                energy = np.sqrt(np.mean(window**2))
-                audio_energy.append(energy)
+        try:
+            duration = video.duration
+            fps = video.fps
+            self._frame_area = None
+
+            # Sample frames
+            frame_interval = int(fps / sample_rate) if sample_rate < fps else 1
+            frame_indices = np.arange(0, int(duration * fps) + 1, frame_interval)
+            frame_indices = frame_indices[frame_indices / fps <= duration]
+
+            print(f"🧠 Analyzing {len(frame_indices)} sampled frames for highlights...")
+
+            # Stream decoded batches through feature extraction; only per-frame scores are kept
+            collected = {'motion_score': [], 'color_vibrancy': [], 'face_presence': [], 'visual_change': []}
+            state = {'hash': None, 'features': None, 'flow_frame': None, 'last': None, 'duplicates': 0}
+
+            # Decode audio in the background while frames are being analyzed
+            with ThreadPoolExecutor(max_workers=1) as audio_pool:
+                audio_future = audio_pool.submit(self._extract_audio_energy, video, sample_rate)
+
+                frame_batches = self._iter_frame_batches(video_path, video, frame_indices, fps)
+                with tqdm(total=len(frame_indices), desc="Analyzing highlights", unit="frame") as progress:
+                    for frames in _prefetch(frame_batches, self.PREFETCH_BATCHES):
+                        for key, values in self._analyze_batch(frames, state).items():
+                            collected[key].append(values)
+                        progress.update(len(frames))
+
+                audio_energy = audio_future.result()
+        finally:
+            video.close()
+
+        batch_features = {
+            key: np.concatenate(values) if values else np.zeros(0, dtype=np.float32)
+            for key, values in collected.items()
+        }
+        frame_count = len(batch_features['motion_score'])
+        timestamps = (frame_indices[:frame_count] / fps).tolist()
+        visual_change = batch_features.pop('visual_change')
 
         # Analyze each frame
         highlight_scores = []
-        engagement_features = []
 
-        print("🧠 Analyzing frames for highlights...")
+        # Score every frame with a single matrix-vector product
+        features_matrix = self._engagement_matrix(batch_features, audio_energy, frame_count)
+        total_scores = features_matrix @ self._weights
 
-        for i, frame in enumerate(tqdm(frames, desc="Analyzing highlights", unit="frame")):
-            # Calculate engagement score
-            engagement = self._calculate_engagement_score(frame, audio_energy[i] if i < len(audio_energy) else 0)
+        for i in range(frame_count):
+            engagement = dict(zip(self._weight_keys, features_matrix[i].tolist()))
+            engagement['visual_change'] = float(visual_change[i])
+            engagement['total_score'] = float(total_scores[i])
 
             # Detect highlight potential
             highlight_score = self._calculate_highlight_score(engagement, timestamps[i], duration)
@@ -138,8 +677,6 @@ class HighlightDetector:
                 'features': engagement
             })
 
-            engagement_features.append(engagement)
-
         # Find optimal clips
         optimal_clips = self._find_optimal_clips(highlight_scores, duration)
 
@@ -148,104 +685,279 @@ class HighlightDetector:
             'video_info': {
                 'duration': duration,
                 'fps': fps,
-                'total_frames_analyzed': len(frames)
+                'total_frames_analyzed': frame_count,
+                'duplicate_frames_skipped': state['duplicates'],
+                'duplicate_ratio': state['duplicates'] / frame_count if frame_count else 0.0
             },
             'highlight_analysis': highlight_scores,
             'optimal_clips': optimal_clips,
-            'engagement_summary': self._summarize_engagement(engagement_features),
+            'engagement_summary': self._summarize_engagement(features_matrix, total_scores),
             'generated_at': datetime.now().isoformat()
         }
 
         return analysis
 
-    def _calculate_engagement_score(self, frame: np.ndarray, audio_energy: float) -> Dict[str, float]:
-        """Calculate engagement score for a single frame"""
-        engagement = {}
+    def _analyze_batch(self, frames: np.ndarray, state: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Compute per-frame visual features for one decoded batch
+
+        Frames that are near-duplicates of the frame before them reuse its
+        scores, skipping ResNet, optical flow and face detection.
 
-        # Motion score (using optical flow estimation)
-        engagement['motion_score'] = self._calculate_motion_score(frame)
+        Args:
+            frames: uint8 array of shape (B, H, W, 3)
+            state: Values carried between batches of the same video
 
-        # Audio energy score
-        engagement['audio_energy'] = min(1.0, audio_energy * 1000)  # Normalize
+        Returns:
+            Dictionary of per-frame feature arrays
+        """
+        hashes = self._perceptual_hashes(frames)
+        previous_hashes = np.concatenate([[state['hash'] if state['hash'] is not None else ~hashes[0]], hashes[:-1]])
+        duplicate = self._hamming_distance(hashes, previous_hashes) <= self.DUPLICATE_HASH_DISTANCE
+        state['hash'] = hashes[-1]
+        state['duplicates'] += int(duplicate.sum())
+
+        unique = frames[~duplicate]
+        results = {}
+        if len(unique):
+            # Queue ResNet for the batch; the CPU features below run while the GPU works
+            pending = self._launch_features(unique)
+
+            batch_features = self._batch_features(unique, state['flow_frame'])
+            state['flow_frame'] = batch_features['flow_frame']
+            results['motion_score'] = batch_features['motion_score']
+            results['color_vibrancy'] = batch_features['color_vibrancy']
+            results['face_presence'] = self._detect_faces(unique, batch_features['gray'])
+
+            features = self._collect_features(pending)
+            results['visual_change'] = self._calculate_visual_change(features, state['features'])
+            state['features'] = features[-1]
+        else:
+            results = {key: np.zeros(0, dtype=np.float32) for key in state['last']}
+
+        # Repeated frames take the scores of the last unique frame before them
+        source = np.cumsum(~duplicate)  # 0 means the last frame of the previous batch
+        carried = state['last'] or {key: 0.0 for key in results}
+        expanded = {
+            key: np.concatenate([[carried[key]], values]).astype(np.float32)[source]
+            for key, values in results.items()
+        }
 
-        # Face presence score
-        engagement['face_presence'] = self._detect_faces(frame)
+        # Carry the last unique frame's own scores, so a repeat that opens the
+        # next batch is penalized once, just like repeats within a batch
+        state['last'] = {key: values[-1] for key, values in expanded.items()}
 
-        # Color vibrancy score
-        engagement['color_vibrancy'] = self._calculate_color_vibrancy(frame)
+        expanded['motion_score'][duplicate] *= self.DUPLICATE_MOTION_PENALTY
+        expanded['visual_change'][duplicate] = 0.0
+        return expanded
 
-        # Text presence score (placeholder - would need OCR)
-        engagement['text_presence'] = 0.0  # TODO: Implement OCR
+    def _perceptual_hashes(self, frames: np.ndarray) -> np.ndarray:
+        """64-bit average hash per frame (8x8 grayscale thumbnail above its mean)"""
+        thumbs = np.stack([
+            cv2.cvtColor(cv2.resize(frame, (8, 8), interpolation=cv2.INTER_AREA), cv2.COLOR_RGB2GRAY)
+            for frame in frames
+        ])
+        bits = thumbs > thumbs.mean(axis=(1, 2), keepdims=True)
+        return np.packbits(bits.reshape(len(frames), 64), axis=1).view(np.uint64).ravel()
 
-        # Calculate total weighted score
-        total_score = sum(
-            engagement[feature] * weight
-            for feature, weight in self.engagement_weights.items()
-        )
+    def _hamming_distance(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Number of differing bits between two arrays of 64-bit hashes"""
+        xor = np.bitwise_xor(a, b)
+        return np.unpackbits(xor.view(np.uint8).reshape(len(xor), 8), axis=1).sum(axis=1)
 
-        engagement['total_score'] = total_score
-        return engagement
+    def _extract_audio_energy(self, video: VideoFileClip, sample_rate: int) -> List[float]:
+        """RMS audio energy per sampling window (empty if the video has no audio)"""
+        if video.audio is None:
+            return []
 
-    def _calculate_motion_score(self, frame: np.ndarray) -> float:
-        """Calculate motion score using edge detection and variance"""
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        audio_samples = video.audio.to_soundarray(fps=44100)
+        if len(audio_samples.shape) > 1:
+            audio_samples = audio_samples.mean(axis=1, dtype=np.float32)  # Convert to mono
 
-        # Calculate variance (higher variance = more motion/texture)
-        variance = np.var(gray.astype(float))
+        # Calculate audio energy in windows
+        window_size = int(44100 * (1 / sample_rate))  # 1 second windows
+        return self._window_rms(audio_samples, window_size).tolist()
 
-        # Normalize to 0-1 scale
-        motion_score = min(1.0, variance / 10000.0)
+    def _window_rms(self, samples: np.ndarray, window_size: int) -> np.ndarray:
+        """RMS energy of consecutive windows, including a trailing partial window"""
+        n_windows = len(samples) // window_size
+        windows = samples[:n_windows * window_size].reshape(n_windows, window_size)
+        rms = np.sqrt(np.einsum('ij,ij->i', windows, windows) / window_size)
 
-        return motion_score
+        tail = samples[n_windows * window_size:]
+        if len(tail):
+            rms = np.append(rms, np.sqrt(np.dot(tail, tail) / len(tail)))
 
-    def _detect_faces(self, frame: np.ndarray) -> float:
-        """Detect faces in frame using Haar cascades"""
-        try:
-            # Convert to grayscale for face detection
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-
-            # Load face cascade (using OpenCV's built-in)
-            face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-
-            # Detect faces
-            faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
-
-            # Score based on number of faces and size
-            if len(faces) == 0:
-                return 0.0
-            elif len(faces) == 1:
-                # Single face - check size relative to frame
-                face_area = faces[0][2] * faces[0][3]
-                frame_area = frame.shape[0] * frame.shape[1]
-                size_ratio = face_area / frame_area
-                return min(1.0, size_ratio * 10)  # Larger faces score higher
-            else:
-                # Multiple faces - diminishing returns
-                return min(1.0, len(faces) * 0.3)
+        return rms
 
-        except Exception as e:
-            print(f"Face detection error: {e}")
-            return 0.0
+    def _engagement_matrix(self, batch_features: Dict[str, np.ndarray],
+                           audio_energy: List[float], count: int) -> np.ndarray:
+        """
+        Stack per-frame engagement features into an (N, F) matrix
+
+        Columns follow the order of self._weight_keys.
+        """
+        columns = dict(batch_features)
 
-    def _calculate_color_vibrancy(self, frame: np.ndarray) -> float:
-        """Calculate color vibrancy score"""
-        # Convert to HSV color space
-        hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
+        # Audio energy per sampled frame, normalized (frames past the audio get 0)
+        audio = np.zeros(count, dtype=np.float32)
+        available = min(count, len(audio_energy))
+        audio[:available] = audio_energy[:available]
+        columns['audio_energy'] = np.minimum(1.0, audio * 1000)
 
-        # Calculate saturation variance (color richness)
-        saturation = hsv[:, :, 1].astype(float)
-        sat_variance = np.var(saturation)
+        # Text presence (placeholder - would need OCR)
+        columns['text_presence'] = np.zeros(count, dtype=np.float32)  # TODO: Implement OCR
 
-        # Calculate value variance (brightness variation)
-        value = hsv[:, :, 2].astype(float)
-        val_variance = np.var(value)
+        return np.column_stack([columns[key] for key in self._weight_keys]).astype(np.float32)
+
+    def _detect_faces(self, frames: np.ndarray, gray: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Score face presence for a stack of frames
+
+        Args:
+            frames: uint8 array of shape (N, H, W, 3)
+            gray: Precomputed uint8 grayscale frames of shape (N, H, W), if available
+
+        Returns:
+            Per-frame face presence scores in the 0-1 range
+        """
+        if len(frames) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        counts = areas = None
+        if self.face_detector is not None:
+            try:
+                counts, areas = self._detect_faces_retina(frames)
+            except Exception as e:
+                print(f"Face detection error, falling back to Haar: {e}")
+
+        if counts is None:
+            counts, areas = self._detect_faces_haar(frames, gray)
+
+        # All frames of a video share a shape, so the area is computed once
+        if self._frame_area is None:
+            self._frame_area = frames.shape[1] * frames.shape[2]
+
+        # Single face - larger faces score higher; multiple faces - diminishing returns
+        single = np.minimum(1.0, areas / self._frame_area * 10)
+        multiple = np.minimum(1.0, counts * 0.3)
+        return np.where(counts == 0, 0.0, np.where(counts == 1, single, multiple))
+
+    def _detect_faces_retina(self, frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Batched RetinaFace detection, returns face counts and first-face areas"""
+        counts = np.zeros(len(frames), dtype=np.int32)
+        areas = np.zeros(len(frames), dtype=np.float32)
+
+        # batch_face expects BGR images
+        images = [np.ascontiguousarray(frame[..., ::-1]) for frame in frames]
+        detections = self.face_detector(images, threshold=0.95, batch_size=self.FEATURE_BATCH_SIZE)
+
+        for i, faces in enumerate(detections):
+            counts[i] = len(faces)
+            if faces:
+                x1, y1, x2, y2 = faces[0][0][:4]
+                areas[i] = (x2 - x1) * (y2 - y1)
+
+        return counts, areas
+
+    def _load_cuda_cascade(self):
+        """GPU Haar cascade when OpenCV was built with CUDA, otherwise None"""
+        try:
+            if self.device == 'cuda' and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                return cv2.cuda.CascadeClassifier_create(
+                    cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                )
+        except (AttributeError, cv2.error):
+            pass
+        return None
+
+    def _detect_faces_haar(self, frames: np.ndarray,
+                           gray_frames: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Haar cascade detection, returns face counts and first-face areas"""
+        counts = np.zeros(len(frames), dtype=np.int32)
+        areas = np.zeros(len(frames), dtype=np.float32)
+
+        # Downscale before detection and scale areas back to full resolution
+        height, width = frames.shape[1:3]
+        scale = min(1.0, self.FACE_DETECT_WIDTH / width)
+        detect_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+        for i, frame in enumerate(frames):
+            try:
+                if gray_frames is not None:
+                    gray = gray_frames[i]
+                else:
+                    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+                if scale < 1.0:
+                    gray = cv2.resize(gray, detect_size, interpolation=cv2.INTER_AREA)
+
+                if self.cuda_face_cascade is not None:
+                    gpu_frame = cv2.cuda_GpuMat()
+                    gpu_frame.upload(gray)
+                    faces = self.cuda_face_cascade.convert(self.cuda_face_cascade.detectMultiScale(gpu_frame))
+                    faces = faces if faces is not None else []
+                else:
+                    faces = self.face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
+
+                counts[i] = len(faces)
+                if len(faces):
+                    areas[i] = faces[0][2] * faces[0][3] / (scale * scale)
+            except Exception as e:
+                print(f"Face detection error: {e}")
+
+        return counts, areas
+
+    def _batch_features(self, frames: np.ndarray,
+                        previous_flow_frame: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Compute motion and color features for a stack of frames at once
 
-        # Combine scores
-        vibrancy = (sat_variance + val_variance) / 2
+        Args:
+            frames: uint8 array of shape (N, H, W, 3)
+            previous_flow_frame: Last 'flow_frame' of the previous batch, if any
 
-        # Normalize to 0-1 scale
-        return min(1.0, vibrancy / 5000.0)
+        Returns:
+            Dictionary of per-frame 'motion_score' and 'color_vibrancy' arrays,
+            the uint8 'gray' frames, and the 'flow_frame' to carry into the next batch
+        """
+        count = len(frames)
+        motion = np.zeros(count, dtype=np.float32)
+        if count == 0:
+            return {'motion_score': motion, 'color_vibrancy': motion.copy(),
+                    'flow_frame': previous_flow_frame, 'gray': np.zeros((0, 0, 0), dtype=np.uint8)}
+
+        if NUMBA_AVAILABLE:
+            # Fused parallel kernel: grayscale and HSV statistics in one pass
+            gray, sat_variance, val_variance = _frame_stats_numba(np.ascontiguousarray(frames))
+        else:
+            # One SIMD color conversion per frame for each of gray and HSV (uint8 throughout)
+            gray = np.stack([cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY) for frame in frames])
+
+            # Saturation and value variance (color richness and brightness variation),
+            # from OpenCV's single-pass SIMD mean/std instead of float64 copies of each plane
+            sat_variance = np.empty(count, dtype=np.float32)
+            val_variance = np.empty(count, dtype=np.float32)
+            for i, frame in enumerate(frames):
+                hsv = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_RGB2HSV)
+                _, std = cv2.meanStdDev(hsv)
+                sat_variance[i] = std[1, 0] ** 2
+                val_variance[i] = std[2, 0] ** 2
+
+        # True motion: dense optical flow between consecutive sampled frames
+        height, width = gray.shape[1:]
+        flow_size = (self.FLOW_WIDTH, max(1, int(height * self.FLOW_WIDTH / width)))
+        previous = previous_flow_frame
+        for i in range(count):
+            small = cv2.resize(gray[i], flow_size, interpolation=cv2.INTER_AREA)
+            if previous is not None and previous.shape == small.shape:
+                flow = self._flow.calc(previous, small, None)
+                magnitude = np.sqrt(flow[..., 0] ** 2 + flow[..., 1] ** 2).mean()
+                motion[i] = min(1.0, magnitude / self.FLOW_NORM)
+            previous = small
+
+        vibrancy = np.minimum(1.0, (sat_variance + val_variance) / 2 / 5000.0)
+
+        return {'motion_score': motion, 'color_vibrancy': vibrancy, 'flow_frame': previous, 'gray': gray}
 
     def _calculate_highlight_score(self, engagement: Dict, timestamp: float, duration: float) -> float:
         """Calculate highlight potential score"""
@@ -267,7 +979,10 @@ class HighlightDetector:
         # Face presence boost
         face_boost = 1.0 + (engagement['face_presence'] * 0.3)
 
-        highlight_score = base_score * time_factor * audio_boost * face_boost
+        # Visual change boost (cuts and new content from ResNet features)
+        change_boost = 1.0 + (engagement.get('visual_change', 0.0) * 0.2)
+
+        highlight_score = base_score * time_factor * audio_boost * face_boost * change_boost
 
         return min(1.0, highlight_score)
 
@@ -277,20 +992,23 @@ class HighlightDetector:
         if not highlight_scores:
             return []
 
-        # Sort by highlight score (descending)
-        sorted_scores = sorted(highlight_scores, key=lambda x: x['highlight_score'], reverse=True)
+        # Top 20 moments by highlight score (descending)
+        top_scores = heapq.nlargest(20, highlight_scores, key=lambda x: x['highlight_score'])
 
         optimal_clips = []
-        used_timestamps = set()
+        used_timestamps = []  # Kept sorted for nearest-neighbour lookups
 
         # Target different clip lengths for variety
         clip_durations = [15, 30, 45, 60]  # seconds
 
-        for score_data in sorted_scores[:20]:  # Consider top 20 moments
+        for score_data in top_scores:
             timestamp = score_data['timestamp']
 
-            # Skip if too close to already selected clips
-            if any(abs(timestamp - used) < 10 for used in used_timestamps):
+            # Skip if too close to already selected clips (only the neighbours can be)
+            i = bisect.bisect_left(used_timestamps, timestamp)
+            if i > 0 and timestamp - used_timestamps[i - 1] < 10:
+                continue
+            if i < len(used_timestamps) and used_timestamps[i] - timestamp < 10:
                 continue
 
             # Choose clip duration based on engagement level
@@ -315,27 +1033,28 @@ class HighlightDetector:
                     'reason': 'AI-detected highlight moment'
                 })
 
-                used_timestamps.add(timestamp)
+                bisect.insort(used_timestamps, timestamp)
 
                 if len(optimal_clips) >= 10:  # Limit to 10 best clips
                     break
 
         return sorted(optimal_clips, key=lambda x: x['start_time'])
 
-    def _summarize_engagement(self, engagement_features: List[Dict]) -> Dict[str, float]:
-        """Summarize engagement statistics"""
-        if not engagement_features:
+    def _summarize_engagement(self, features_matrix: np.ndarray, total_scores: np.ndarray) -> Dict[str, float]:
+        """Summarize engagement statistics from the (N, F) feature matrix"""
+        if len(total_scores) == 0:
             return {}
 
-        # Calculate averages
-        summary = {}
+        # Stack the summarized columns once and reduce along the frame axis
         feature_keys = ['motion_score', 'audio_energy', 'face_presence', 'color_vibrancy', 'total_score']
+        columns = [self._weight_keys.index(key) for key in feature_keys[:-1]]
+        values = np.column_stack([features_matrix[:, columns], total_scores])
 
-        for key in feature_keys:
-            values = [f[key] for f in engagement_features]
-            summary[f'avg_{key}'] = np.mean(values)
-            summary[f'max_{key}'] = max(values)
-            summary[f'min_{key}'] = min(values)
+        summary = {}
+        for key, avg, high, low in zip(feature_keys, values.mean(axis=0), values.max(axis=0), values.min(axis=0)):
+            summary[f'avg_{key}'] = float(avg)
+            summary[f'max_{key}'] = float(high)
+            summary[f'min_{key}'] = float(low)
 
         return summary
 
@@ -345,9 +1064,18 @@ class SpeechToTextGenerator:
     Generate captions and transcripts from video audio
     """
 
-    def __init__(self, language: str = 'en-US'):
+    SAMPLE_RATE = 16000  # Speech recognizers expect 16 kHz mono
+
+    def __init__(self, language: str = 'en-US', whisper_model: str = 'base'):
+        """
+        Args:
+            language: Recognition language code
+            whisper_model: faster-whisper model size, used when faster-whisper is installed
+        """
         self.language = language
         self.recognizer = sr.Recognizer()
+        self.whisper_model = whisper_model
+        self._whisper = None
 
     def generate_transcript(self, video_path: Path) -> Dict[str, Any]:
         """
@@ -366,10 +1094,6 @@ class SpeechToTextGenerator:
         if video.audio is None:
             return {'transcript': '', 'segments': [], 'error': 'No audio found'}
 
-        # Export audio to temporary WAV file
-        temp_audio = video_path.parent / f"temp_audio_{video_path.stem}.wav"
-        video.audio.write_audiofile(str(temp_audio), verbose=False, logger=None)
-
         transcript_data = {
             'transcript': '',
             'segments': [],
@@ -378,43 +1102,122 @@ class SpeechToTextGenerator:
         }
 
         try:
-            # Load audio file for speech recognition
-            with sr.AudioFile(str(temp_audio)) as source:
-                audio = self.recognizer.record(source)
-
-                # Get full transcript
-                try:
-                    transcript = self.recognizer.recognize_google(audio, language=self.language)
-                    transcript_data['transcript'] = transcript
-                except sr.UnknownValueError:
-                    transcript_data['error'] = 'Could not understand audio'
-                except sr.RequestError as e:
-                    transcript_data['error'] = f'Speech recognition service error: {e}'
-
-            # Note: For timestamped segments, would need more advanced speech recognition
-            # This is a simplified implementation
+            # Decode the audio once, straight to 16 kHz mono PCM (no temp file)
+            pcm = video.audio.to_soundarray(fps=self.SAMPLE_RATE)
+            if len(pcm.shape) > 1:
+                pcm = pcm.mean(axis=1, dtype=np.float32)
+            pcm = np.clip(pcm, -1.0, 1.0).astype(np.float32)
+
+            if FASTER_WHISPER_AVAILABLE and self.whisper_model:
+                self._transcribe_whisper(pcm, transcript_data)
+            else:
+                self._transcribe_google(pcm, transcript_data)
 
         except Exception as e:
             transcript_data['error'] = str(e)
-        finally:
-            # Clean up temporary file
-            if temp_audio.exists():
-                temp_audio.unlink()
 
         return transcript_data
 
+    def _transcribe_google(self, pcm: np.ndarray, transcript_data: Dict[str, Any]):
+        """Full transcript from Google Speech Recognition (no timestamps)"""
+        pcm_bytes = (pcm * 32767).astype(np.int16).tobytes()
+        audio = sr.AudioData(pcm_bytes, sample_rate=self.SAMPLE_RATE, sample_width=2)
+
+        try:
+            transcript = self.recognizer.recognize_google(audio, language=self.language)
+            transcript_data['transcript'] = transcript
+        except sr.UnknownValueError:
+            transcript_data['error'] = 'Could not understand audio'
+        except sr.RequestError as e:
+            transcript_data['error'] = f'Speech recognition service error: {e}'
+
+    def _transcribe_whisper(self, pcm: np.ndarray, transcript_data: Dict[str, Any]):
+        """Local faster-whisper transcription with timestamped segments"""
+        if self._whisper is None:
+            self._whisper = WhisperModel(self.whisper_model, device='cpu', compute_type='int8')
+
+        segments, _ = self._whisper.transcribe(
+            pcm,
+            language=self.language.split('-')[0],
+            word_timestamps=True
+        )
+
+        for segment in segments:
+            transcript_data['segments'].append({
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text.strip(),
+                'words': [
+                    {'start': word.start, 'end': word.end, 'word': word.word.strip()}
+                    for word in (segment.words or [])
+                ]
+            })
+
+        transcript_data['transcript'] = ' '.join(seg['text'] for seg in transcript_data['segments'])
+
 
-def analyze_video_content(video_path: Path, use_ai: bool = True) -> Dict[str, Any]:
+ANALYSIS_CACHE_DIR = Path.home() / '.cache' / 'ltw_clipper'
+
+
+def _content_key(video_path: Path) -> str:
+    """
+    Cache key for a video file: hash of its first 1 MB plus its size
+
+    The hash is remembered per (path, size, mtime) so unchanged files are
+    not read at all on later runs.
+    """
+    stat = video_path.stat()
+    index_file = ANALYSIS_CACHE_DIR / 'index.json'
+    stamp = f"{video_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    try:
+        index = json.loads(index_file.read_text())
+    except (OSError, ValueError):
+        index = {}
+
+    if stamp in index:
+        return index[stamp]
+
+    with open(video_path, 'rb') as f:
+        head = f.read(1 << 20)
+
+    if XXHASH_AVAILABLE:
+        digest = xxhash.xxh3_128(head + str(stat.st_size).encode()).hexdigest()
+    else:
+        digest = hashlib.blake2b(head + str(stat.st_size).encode(), digest_size=16).hexdigest()
+
+    index[stamp] = digest
+    ANALYSIS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    index_file.write_text(json.dumps(index))
+    return digest
+
+
+def analyze_video_content(video_path: Path, use_ai: bool = True, force: bool = False) -> Dict[str, Any]:
     """
     Comprehensive video content analysis
 
     Args:
         video_path: Path to video file
         use_ai: Whether to use AI-powered analysis
+        force: Re-run the analysis even if a cached result exists
 
     Returns:
         Complete analysis results
     """
+    cache_file = None
+    if use_ai:
+        try:
+            cache_file = ANALYSIS_CACHE_DIR / f"{_content_key(video_path)}.json"
+            if cache_file.exists() and not force:
+                print(f"♻️ Using cached analysis for {video_path.name}")
+                results = json.loads(cache_file.read_text())
+                results['video_path'] = str(video_path)
+                results['filename'] = video_path.name
+                return results
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Analysis cache unavailable: {e}")
+            cache_file = None
+
     results = {
         'video_path': str(video_path),
         'filename': video_path.name,
@@ -432,6 +1235,12 @@ def analyze_video_content(video_path: Path, use_ai: bool = True) -> Dict[str, An
         transcript = stt_generator.generate_transcript(video_path)
         results['transcript'] = transcript
 
+        if cache_file is not None:
+            try:
+                cache_file.write_text(json.dumps(results, default=str))
+            except OSError as e:
+                print(f"⚠️ Could not cache analysis: {e}")
+
     return results
 
 
@@ -4,9 +4,71 @@
 
 import argparse
 import os
+import subprocess
+import numpy as np
 from moviepy import VideoFileClip
-from pydub import AudioSegment
-from pydub.silence import detect_nonsilent
+
+# Audio is analysed as 16 kHz mono: a whole number of samples per millisecond
+SAMPLE_RATE = 16000
+SAMPLES_PER_MS = SAMPLE_RATE // 1000
+
+def read_audio_samples(video_path):
+    """
+    Decodes a video's audio track straight into memory as mono int16 samples
+    (ffmpeg pipe, no temporary WAV on disk).
+    """
+    cmd = [
+        "ffmpeg", "-v", "error", "-i", video_path,
+        "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "-"
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg could not decode audio: {result.stderr.decode(errors='replace').strip()}")
+    return np.frombuffer(result.stdout, dtype=np.int16)
+
+def detect_nonsilent(samples, min_silence_len=500, silence_thresh=-40, seek_step=100):
+    """
+    Returns [start_ms, end_ms] ranges that are not silent, with the same
+    window/step/merge rules as pydub.silence.detect_nonsilent.
+    """
+    length_ms = len(samples) // SAMPLES_PER_MS
+    if length_ms < min_silence_len:
+        return [[0, length_ms]]
+    
+    # Energy per millisecond, squared in float64 one minute at a time to bound memory
+    blocks = samples[:length_ms * SAMPLES_PER_MS].reshape(length_ms, SAMPLES_PER_MS)
+    energy = np.zeros(length_ms + 1)
+    for i in range(0, length_ms, 60000):
+        chunk = blocks[i:i + 60000].astype(np.float64)
+        energy[i + 1:i + 1 + len(chunk)] = np.einsum('ij,ij->i', chunk, chunk)
+    # Prefix sums give every window's RMS in O(1)
+    np.cumsum(energy, out=energy)
+    
+    last_start = length_ms - min_silence_len
+    starts = np.arange(0, last_start + 1, seek_step)
+    if last_start % seek_step:
+        starts = np.append(starts, last_start)
+    # Truncated to an integer like audioop.rms
+    rms = np.floor(np.sqrt((energy[starts + min_silence_len] - energy[starts]) / (min_silence_len * SAMPLES_PER_MS)))
+    threshold = 10 ** (silence_thresh / 20) * 32768
+    silence_starts = starts[rms <= threshold]
+    if not len(silence_starts):
+        return [[0, length_ms]]
+    
+    # Merge silent windows into ranges: a new range starts wherever the next
+    # silent window is neither one step on nor overlapping the previous window
+    gaps = np.diff(silence_starts)
+    new_range = np.ones(len(silence_starts), dtype=bool)
+    new_range[1:] = (gaps != seek_step) & (gaps > min_silence_len)
+    first = np.flatnonzero(new_range)
+    range_starts = silence_starts[first]
+    range_ends = silence_starts[np.append(first[1:] - 1, len(silence_starts) - 1)] + min_silence_len
+    
+    # Non-silent ranges are the gaps between silent ones; empty edge ranges are dropped
+    nonsilent_starts = np.concatenate(([0], range_ends))
+    nonsilent_ends = np.concatenate((range_starts, [length_ms]))
+    keep = nonsilent_ends > nonsilent_starts
+    return np.stack((nonsilent_starts[keep], nonsilent_ends[keep]), axis=1).tolist()
 
 def generate_edl(video_path, output_edl):
     """
@@ -16,41 +78,41 @@ def generate_edl(video_path, output_edl):
     
     # Extract audio
     video = VideoFileClip(video_path)
-    audio_path = "temp_audio.wav"
-    video.audio.write_audiofile(audio_path, logger=None)
-    
-    # Load into pydub
-    audio = AudioSegment.from_wav(audio_path)
+    samples = read_audio_samples(video_path)
+    audio_len_ms = len(samples) // SAMPLES_PER_MS
     
     # Detect non-silent chunks
     # min_silence_len: ms (500ms = 0.5s)
     # silence_thresh: dBFS (anything quieter than -40dB is silence)
     print("   🔍 Detecting speech...")
-    chunks = detect_nonsilent(audio, min_silence_len=500, silence_thresh=-40, seek_step=100)
+    chunks = detect_nonsilent(samples, min_silence_len=500, silence_thresh=-40, seek_step=100)
     
     # Create EDL content
     edl_content = f"TITLE: {os.path.basename(video_path)}\nFCM: NON-DROP FRAME\n"
     
     # Convert ms to frames (assuming 30fps for simplicity, ideally read from video)
     fps = video.fps
+    # Frames per 1000 seconds, so the frame count is pure integer math
+    fps_milli = round(fps * 1000)
     
     def ms_to_tc(ms):
-        total_seconds = ms / 1000
-        hours = int(total_seconds // 3600)
-        minutes = int((total_seconds % 3600) // 60)
-        seconds = int(total_seconds % 60)
-        frames = int((total_seconds - int(total_seconds)) * fps)
+        seconds, ms_rem = divmod(int(ms), 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        frames = ms_rem * fps_milli // 1000000
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
 
     # Create timeline segments
     timeline_start_ms = 0
+    # Each record-in is the previous record-out
+    dst_out = ms_to_tc(timeline_start_ms)
     
     print(f"   ✂️ Found {len(chunks)} active segments. Generating EDL...")
     
     for i, (start_ms, end_ms) in enumerate(chunks):
         # Add a little buffer (padding)
         start_ms = max(0, start_ms - 200)
-        end_ms = min(len(audio), end_ms + 200)
+        end_ms = min(audio_len_ms, end_ms + 200)
         
         duration_ms = end_ms - start_ms
         
@@ -59,7 +121,7 @@ def generate_edl(video_path, output_edl):
         src_out = ms_to_tc(end_ms)
         
         # Record In/Out (Timeline position)
-        dst_in = ms_to_tc(timeline_start_ms)
+        dst_in = dst_out
         dst_out = ms_to_tc(timeline_start_ms + duration_ms)
         
         # EDL Line
@@ -75,7 +137,6 @@ def generate_edl(video_path, output_edl):
         f.write(edl_content)
         
     # Cleanup
-    os.remove(audio_path)
     video.close()
     
     print(f"✅ EDL Saved: {output_edl}")
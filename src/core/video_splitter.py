@@ -9,8 +9,10 @@ import sys
 from pathlib import Path
 from moviepy import VideoFileClip
 import argparse
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 import re
+import queue
+import threading
 from tqdm import tqdm
 import subprocess
 import json
@@ -20,13 +22,25 @@ import cv2
 import numpy as np
 from skimage.metrics import structural_similarity as ssim
 
+# Absolute path of the most recently generated Resolve import script (read by the GUI)
+LATEST_IMPORT_POINTER = Path.home() / ".ltw_clipper" / "latest_import"
+
+
+class SplitCancelled(Exception):
+    """Raised when a split is stopped through cancel_event"""
+
 
 class VideoSplitter:
+    # Finished segments buffered between the ffmpeg reader thread and bookkeeping
+    SEGMENT_PREFETCH = 8
+
     def __init__(self, input_dir: str = ".", output_dir: str = None, clip_duration: int = 30,
                  naming_pattern: str = "{name}_part_{num:03d}", quality: str = "youtube_hd",
                  resolve_integration: bool = True, project_name: str = None,
                  scene_detection: bool = False, min_scene_duration: int = 10,
-                 batch_mode: bool = False, resume_batch: bool = False):
+                 batch_mode: bool = False, resume_batch: bool = False,
+                 progress_cb: Optional[Callable[[int, int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
         """
         Initialize the VideoSplitter
 
@@ -42,6 +56,8 @@ class VideoSplitter:
             min_scene_duration: Minimum duration for detected scenes (seconds)
             batch_mode: Process all videos in input directory
             resume_batch: Resume interrupted batch processing
+            progress_cb: Called with (clips done, total clips) as each clip finishes
+            cancel_event: When set, the running ffmpeg is terminated and splitting stops
         """
         self.input_dir = Path(input_dir)
 
@@ -59,6 +75,8 @@ class VideoSplitter:
         self.min_scene_duration = min_scene_duration
         self.batch_mode = batch_mode
         self.resume_batch = resume_batch
+        self.progress_cb = progress_cb
+        self.cancel_event = cancel_event
 
         # Batch processing state
         self.batch_progress_file = Path(self.output_dir) / "batch_progress.json"
@@ -330,12 +348,14 @@ class VideoSplitter:
         
         return video_files
     
-    def split_video(self, video_path: Path) -> int:
+    def split_video(self, video_path: Path, save_project: bool = True) -> int:
         """
         Split a single video into clips
         
         Args:
             video_path: Path to the video file
+            save_project: Write metadata and Resolve files after splitting
+                (disabled when a caller merges results from several workers)
             
         Returns:
             Number of clips created
@@ -388,88 +408,69 @@ class VideoSplitter:
             # Clean the base filename
             base_name = self.clean_filename(video_path.stem)
             
-            # Create clips with progress bar
-            clips_created = 0
-            for i, (start_time, end_time) in enumerate(tqdm(clip_times, desc=f"Creating clips", unit="clip")):
+            # Contiguous clips are cut by one ffmpeg run; anything it misses is encoded per clip
+            created = set()
+            contiguous = bool(clip_times) and clip_times[0][0] == 0 and all(
+                prev[1] == cur[0] for prev, cur in zip(clip_times, clip_times[1:])
+            )
+            if contiguous:
                 try:
+                    created = self._split_segments(video_path, clip_times, base_name)
+                except Exception as segment_error:
+                    print(f"  Segment pass failed ({segment_error}), encoding clips individually")
+
+            remaining = [(i, times) for i, times in enumerate(clip_times) if i not in created]
+            for i, (start_time, end_time) in tqdm(remaining, desc=f"Creating clips", unit="clip", disable=not remaining):
+                if self._cancelled():
+                    print("  ⏹️ Cancelled")
+                    break
+                try:
+                    output_filename, output_path = self._clip_output(base_name, i)
                     segment_duration = max(0.001, end_time - start_time)
                     
-                    # Generate timestamp for professional naming
-                    start_time_formatted = "02d"
-                    end_time_formatted = "02d"
-
-                    # Generate output filename using naming pattern
-                    output_filename = self.naming_pattern.format(
-                        name=base_name,
-                        num=i+1,
-                        duration=self.clip_duration,
-                        timestamp=start_time_formatted,
-                        project=self.project_name
-                    ) + ".mp4"
-                    output_path = self.clips_dir / output_filename
-                    
                     # Build ffmpeg command ensuring audio is always encoded
-                    quality_setting = self.quality_settings[self.quality]
                     ffmpeg_cmd = [
                         "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
                         "-ss", f"{start_time:.3f}",
                         "-t", f"{segment_duration:.3f}",
                         "-i", str(video_path),
-                        "-c:v", "libx264",
-                        "-pix_fmt", "yuv420p",
-                        "-preset", "fast",
-                        "-c:a", "aac",
-                        "-b:a", "160k",
-                        "-ar", "44100",
-                        "-ac", "2",
-                    ]
-                    # Apply quality controls
-                    if quality_setting['bitrate']:
-                        ffmpeg_cmd += ["-b:v", quality_setting['bitrate']]
-                    if quality_setting['resolution']:
-                        ffmpeg_cmd += ["-vf", f"scale={quality_setting['resolution']}"]
-                    ffmpeg_cmd += [str(output_path)]
+                    ] + self._encode_args() + [str(output_path)]
                     
                     try:
-                        subprocess.run(ffmpeg_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                        self._run_ffmpeg(ffmpeg_cmd)
                     except subprocess.CalledProcessError as e:
                         # Retry with audio resample filter if first attempt fails
                         print(f"    Audio encode retry for clip {i+1}...")
                         retry_cmd = ffmpeg_cmd[:-1] + ["-af", "aresample=async=1:first_pts=0", str(output_path)]
-                        subprocess.run(retry_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                        self._run_ffmpeg(retry_cmd)
                     
-                    clips_created += 1
-
-                    # Track metadata for Resolve integration
-                    clip_info = {
-                        'filename': output_filename,
-                        'filepath': str(output_path),
-                        'clip_number': i+1,
-                        'start_time': start_time,
-                        'end_time': end_time,
-                        'duration': end_time - start_time,
-                        'timestamp': datetime.now().isoformat(),
-                        'quality': self.quality,
-                        'source_video': video_path.name
-                    }
-                    self.clip_metadata.append(clip_info)
-
+                    created.add(i)
+                    self._record_clip(video_path, i, output_filename, output_path, start_time, end_time)
+                    if self.progress_cb:
+                        self.progress_cb(len(created), len(clip_times))
+
+                except SplitCancelled:
+                    output_path.unlink(missing_ok=True)  # Partial clip
+                    print("  ⏹️ Cancelled")
+                    break
                 except Exception as clip_error:
                     print(f"    ✗ Error creating clip {i+1}: {str(clip_error)}")
                     # Continue with next clip instead of stopping
                     continue
+            clips_created = len(created)
             
-            # Save metadata
-            self._save_metadata(video_path.name)
+            if save_project:
+                # Save metadata
+                self._save_metadata(video_path.name)
 
-            # Generate Resolve project files if enabled
-            if self.resolve_integration:
-                self._generate_resolve_project(video_path.name)
+                # Generate Resolve project files if enabled
+                if self.resolve_integration:
+                    self._generate_resolve_project(video_path.name)
 
             # Clean up
             video.close()
             print(f"  ✓ Completed: {clips_created} clips created in {self.clips_dir}")
-            if self.resolve_integration:
+            if save_project and self.resolve_integration:
                 print(f"  📁 Resolve project files saved to {self.resolve_dir}")
             print()
             return clips_created
@@ -478,6 +479,161 @@ class VideoSplitter:
             print(f"  ✗ Error processing {video_path.name}: {str(e)}\n")
             return 0
     
+    def _cancelled(self) -> bool:
+        """Whether the caller has asked to stop"""
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def _run_ffmpeg(self, ffmpeg_cmd: List[str]):
+        """Run ffmpeg to completion, terminating it promptly if cancel_event is set"""
+        proc = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=None if self.cancel_event is None else 0.2)
+                break
+            except subprocess.TimeoutExpired:
+                if self._cancelled():
+                    proc.terminate()
+                    proc.communicate()
+                    raise SplitCancelled()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, ffmpeg_cmd, stdout, stderr)
+
+    def _clip_output(self, base_name: str, index: int) -> tuple:
+        """Return (filename, path) for the clip at index using the naming pattern"""
+        # Generate timestamp for professional naming
+        start_time_formatted = "02d"
+
+        output_filename = self.naming_pattern.format(
+            name=base_name,
+            num=index+1,
+            duration=self.clip_duration,
+            timestamp=start_time_formatted,
+            project=self.project_name
+        ) + ".mp4"
+        return output_filename, self.clips_dir / output_filename
+
+    def _encode_args(self) -> List[str]:
+        """ffmpeg output options for the selected quality"""
+        quality_setting = self.quality_settings[self.quality]
+        args = [
+            "-c:v", "libx264",
+            "-pix_fmt", "yuv420p",
+            "-preset", "fast",
+            "-c:a", "aac",
+            "-b:a", "160k",
+            "-ar", "44100",
+            "-ac", "2",
+        ]
+        # Apply quality controls
+        if quality_setting['bitrate']:
+            args += ["-b:v", quality_setting['bitrate']]
+        if quality_setting['resolution']:
+            args += ["-vf", f"scale={quality_setting['resolution']}"]
+        return args
+
+    def _record_clip(self, video_path: Path, index: int, output_filename: str,
+                     output_path: Path, start_time: float, end_time: float):
+        """Track metadata for Resolve integration"""
+        self.clip_metadata.append({
+            'filename': output_filename,
+            'filepath': str(output_path),
+            'clip_number': index+1,
+            'start_time': start_time,
+            'end_time': end_time,
+            'duration': end_time - start_time,
+            'timestamp': datetime.now().isoformat(),
+            'quality': self.quality,
+            'source_video': video_path.name
+        })
+
+    def _split_segments(self, video_path: Path, clip_times: List[tuple], base_name: str) -> set:
+        """
+        Encode contiguous clips in a single ffmpeg run with the segment muxer
+
+        ffmpeg decodes and encodes the whole video once while a reader thread parses
+        its segment list from stdout into a bounded queue; this thread renames each
+        finished segment and records its metadata while encoding continues.
+
+        Args:
+            video_path: Path to the video file
+            clip_times: Contiguous (start, end) pairs starting at 0
+            base_name: Cleaned source name for the naming pattern
+
+        Returns:
+            Indices of the clips that were created
+        """
+        cuts = ",".join(f"{end:.3f}" for _, end in clip_times[:-1])
+        temp_prefix = f".segment_{os.getpid()}_"
+        ffmpeg_cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-i", str(video_path),
+        ] + self._encode_args()
+        if cuts:
+            # Keyframes at the cut points so segments split exactly on clip boundaries
+            ffmpeg_cmd += ["-force_key_frames", cuts, "-segment_times", cuts]
+        ffmpeg_cmd += [
+            "-f", "segment",
+            "-reset_timestamps", "1",
+            "-segment_list", "pipe:1",
+            "-segment_list_type", "csv",
+            str(self.clips_dir / f"{temp_prefix}%05d.mp4"),
+        ]
+
+        proc = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        finished = queue.Queue(maxsize=self.SEGMENT_PREFETCH)
+
+        def read_segment_list():
+            # CSV rows are "filename,start,end"; the filename is all we need
+            for line in proc.stdout:
+                if line.strip():
+                    finished.put(line.rsplit(",", 2)[0].strip('"'))
+            finished.put(None)
+
+        reader = threading.Thread(target=read_segment_list, daemon=True)
+        reader.start()
+
+        created = set()
+        try:
+            with tqdm(total=len(clip_times), desc="Creating clips", unit="clip") as bar:
+                index = 0
+                while True:
+                    try:
+                        segment_name = finished.get(timeout=0.2)
+                    except queue.Empty:
+                        if self._cancelled():
+                            proc.terminate()
+                            # Drain until the reader hits EOF so it can exit
+                            while finished.get() is not None:
+                                pass
+                            break
+                        continue
+                    if segment_name is None:
+                        break
+                    if index < len(clip_times):
+                        start_time, end_time = clip_times[index]
+                        output_filename, output_path = self._clip_output(base_name, index)
+                        os.replace(self.clips_dir / segment_name, output_path)
+                        created.add(index)
+                        self._record_clip(video_path, index, output_filename, output_path, start_time, end_time)
+                        if self.progress_cb:
+                            self.progress_cb(len(created), len(clip_times))
+                        bar.update(1)
+                    index += 1
+        except BaseException:
+            proc.kill()
+            raise
+
+        reader.join()
+        error = proc.stderr.read()
+        if proc.wait() != 0 and not self._cancelled():
+            print(f"  Segment pass exited with code {proc.returncode}: {error.strip()}")
+
+        # Drop any partial segment left behind by a failed run
+        for leftover in self.clips_dir.glob(f"{temp_prefix}*.mp4"):
+            leftover.unlink(missing_ok=True)
+
+        return created
+
     def split_all_videos(self) -> int:
         """Split all videos - uses batch processing if batch_mode is enabled"""
         if self.batch_mode:
@@ -628,6 +784,11 @@ end
         lua_file = self.resolve_dir / f"{self.project_name}_import.lua"
         with open(lua_file, 'w', encoding='utf-8') as f:
             f.write(batch_script)
+        try:
+            LATEST_IMPORT_POINTER.parent.mkdir(parents=True, exist_ok=True)
+            LATEST_IMPORT_POINTER.write_text(str(lua_file.resolve()), encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️  Could not record latest import script: {e}")
 
         # Create comprehensive README
         readme_content = f"""# 🎬 DaVinci Resolve Project: {self.project_name}
@@ -720,6 +881,22 @@ README.md                         # This documentation
         print(f"     Use the Lua script for automated import")
 
 
+def _split_video_worker(video_path: Path, settings: Dict[str, Any]) -> tuple:
+    """
+    Split one video with a fresh VideoSplitter (picklable entry point for worker processes)
+
+    Args:
+        video_path: Path to the video file
+        settings: VideoSplitter keyword arguments
+
+    Returns:
+        Tuple of (clips created, clip metadata) for the caller to merge
+    """
+    splitter = VideoSplitter(**settings)
+    clips_created = splitter.split_video(Path(video_path), save_project=False)
+    return clips_created, splitter.clip_metadata
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Split videos into 30-second clips",
@@ -4,20 +4,65 @@ Drag-and-drop file selection with preview
 """
 
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import filedialog
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import sys
 import os
+import re
+import threading
 
 from ..theme import theme, get_font
+from ..utils.mousewheel import bind_mousewheel
 
-# Try to import drag & drop support
-try:
-    from tkinterdnd2 import DND_FILES
-    DND_AVAILABLE = True
-except ImportError:
-    DND_AVAILABLE = False
+# Drag & drop support is probed lazily, after the window is up
+_DND_FILES: Optional[str] = None
+_DND_PROBED = False
+
+
+def _dnd_files() -> Optional[str]:
+    """Import tkinterdnd2 on first use; returns its DND_FILES type or None"""
+    global _DND_FILES, _DND_PROBED
+    if not _DND_PROBED:
+        _DND_PROBED = True
+        try:
+            from tkinterdnd2 import DND_FILES
+            _DND_FILES = DND_FILES
+        except ImportError:
+            pass
+    return _DND_FILES
+
+
+# Video file extensions accepted by the picker
+VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm'})
+_VIDEO_EXT_NAMES = frozenset(ext[1:] for ext in VIDEO_EXTS)
+
+# One dropped path per match: "{with spaces}" or a bare token
+_DROP_RE = re.compile(r'\{([^}]*)\}|(\S+)')
+
+
+def _iter_videos(root: str) -> Iterator[Path]:
+    """Walk a directory tree with os.scandir, yielding video files"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.rpartition('.')[2].lower() in _VIDEO_EXT_NAMES and entry.is_file():
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _scan_videos(directory: Path) -> List[Path]:
+    """Find all video files under a directory (recursive)"""
+    return sorted(_iter_videos(str(directory)))
 
 
 class FileCard(ctk.CTkFrame):
@@ -53,30 +98,23 @@ class FileCard(ctk.CTkFrame):
         info_frame = ctk.CTkFrame(self, fg_color="transparent")
         info_frame.pack(side="left", fill="both", expand=True, padx=theme.spacing.sm)
         
-        name_label = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             info_frame,
-            text=self.filepath.name[:40] + ("..." if len(self.filepath.name) > 40 else ""),
+            text="",
             font=get_font("sm"),
             text_color=theme.colors.text_primary,
             anchor="w"
         )
-        name_label.pack(anchor="w")
+        self.name_label.pack(anchor="w")
         
-        # Get file size
-        try:
-            size_mb = self.filepath.stat().st_size / (1024 * 1024)
-            size_text = f"{size_mb:.1f} MB"
-        except:
-            size_text = "Unknown size"
-            
-        size_label = ctk.CTkLabel(
+        self.size_label = ctk.CTkLabel(
             info_frame,
-            text=size_text,
+            text="",
             font=get_font("xs"),
             text_color=theme.colors.text_muted,
             anchor="w"
         )
-        size_label.pack(anchor="w")
+        self.size_label.pack(anchor="w")
         
         # Remove button
         remove_btn = ctk.CTkButton(
@@ -92,6 +130,21 @@ class FileCard(ctk.CTkFrame):
         )
         remove_btn.pack(side="right", padx=theme.spacing.sm)
         
+        self.set_file(self.filepath)
+        
+    def set_file(self, filepath: Path):
+        """Show a different file in this card (cards are reused as the list scrolls)"""
+        self.filepath = filepath
+        self.name_label.configure(text=filepath.name[:40] + ("..." if len(filepath.name) > 40 else ""))
+        
+        # Get file size
+        try:
+            size_mb = filepath.stat().st_size / (1024 * 1024)
+            size_text = f"{size_mb:.1f} MB"
+        except:
+            size_text = "Unknown size"
+        self.size_label.configure(text=size_text)
+        
     def _on_remove(self):
         """Handle remove button click"""
         if self.on_remove:
@@ -101,6 +154,10 @@ class FileCard(ctk.CTkFrame):
 class FilePicker(ctk.CTkFrame):
     """Professional file picker with drag-and-drop"""
     
+    # Virtualized file list: only rows in view (plus a buffer) get widgets
+    ROW_HEIGHT = 54  # FileCard height plus vertical padding
+    ROW_BUFFER = 2
+    
     def __init__(self, parent, on_files_changed: Optional[Callable] = None, 
                  multiple: bool = True, **kwargs):
         super().__init__(
@@ -112,7 +169,19 @@ class FilePicker(ctk.CTkFrame):
         self.on_files_changed = on_files_changed
         self.multiple = multiple
         self.selected_files: List[Path] = []
-        self.file_cards: List[FileCard] = []
+        self.enabled = True
+        self._dnd_registered = False
+        
+        # Rendered rows: file index -> (card, canvas window id)
+        self._rendered: Dict[int, Tuple[FileCard, int]] = {}
+        # Hidden rows kept for reuse instead of being destroyed
+        self._spare_rows: List[Tuple[FileCard, int]] = []
+        
+        # Folder scan results keyed by directory, valid while its mtime is unchanged
+        self._scan_cache: Dict[Path, Tuple[float, List[Path]]] = {}
+        
+        # Videos from a drop whose scan finished while selection was locked
+        self._held_drop: List[Path] = []
         
         self._create_widgets()
         
@@ -141,13 +210,15 @@ class FilePicker(ctk.CTkFrame):
         )
         drop_icon.pack()
         
+        self.drop_prompt = "Click to select video files"
         drop_text = ctk.CTkLabel(
             drop_content,
-            text="Drag & drop video files here" if DND_AVAILABLE else "Click to select video files",
+            text=self.drop_prompt,
             font=get_font("md"),
             text_color=theme.colors.text_secondary
         )
         drop_text.pack(pady=(theme.spacing.xs, 0))
+        self.drop_text = drop_text
         
         drop_subtext = ctk.CTkLabel(
             drop_content,
@@ -164,25 +235,31 @@ class FilePicker(ctk.CTkFrame):
         drop_text.bind("<Button-1>", lambda e: self.browse_files())
         drop_subtext.bind("<Button-1>", lambda e: self.browse_files())
         
-        # Enable drag & drop if available
-        if DND_AVAILABLE:
-            try:
-                self.drop_zone.drop_target_register(DND_FILES)
-                self.drop_zone.dnd_bind('<<Drop>>', self._on_drop)
-            except:
-                pass  # DND registration failed
+        # Enable drag & drop once the window is shown
+        self.after_idle(self._enable_dnd)
         
         # Hover effects
         self.drop_zone.bind("<Enter>", self._on_hover_enter)
         self.drop_zone.bind("<Leave>", self._on_hover_leave)
         
-        # File list container
-        self.file_list_frame = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent",
-            height=150
+        # File list container (virtualized canvas)
+        list_container = ctk.CTkFrame(self, fg_color="transparent")
+        list_container.pack(fill="both", expand=True)
+        
+        self.file_canvas = tk.Canvas(
+            list_container,
+            height=150,
+            bg=theme.colors.bg_secondary,
+            highlightthickness=0,
+            bd=0
         )
-        self.file_list_frame.pack(fill="both", expand=True)
+        self.file_scrollbar = ctk.CTkScrollbar(list_container, command=self._on_list_scroll)
+        self.file_canvas.configure(yscrollcommand=self.file_scrollbar.set)
+        self.file_scrollbar.pack(side="right", fill="y")
+        self.file_canvas.pack(side="left", fill="both", expand=True)
+        
+        self.file_canvas.bind("<Configure>", self._on_list_resize)
+        bind_mousewheel(self.file_canvas, self._on_list_wheel)
         
         # File count label
         self.count_label = ctk.CTkLabel(
@@ -193,6 +270,46 @@ class FilePicker(ctk.CTkFrame):
         )
         self.count_label.pack(anchor="w", pady=(theme.spacing.sm, 0))
         
+    def _enable_dnd(self):
+        """Register the drop zone as a drop target if tkinterdnd2 is available"""
+        dnd_files = _dnd_files()
+        if dnd_files is None:
+            return
+        try:
+            self.drop_zone.drop_target_register(dnd_files)
+            self.drop_zone.dnd_bind('<<Drop>>', self._on_drop)
+        except:
+            return  # DND registration failed
+            
+        self._dnd_registered = True
+        self.drop_prompt = "Drag & drop video files here"
+        if self.enabled:
+            self.drop_text.configure(text=self.drop_prompt)
+        else:
+            self.drop_zone.drop_target_unregister()
+            
+    def set_enabled(self, enabled: bool):
+        """Accept or refuse new files; the drop target is unregistered while disabled"""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        
+        if self._dnd_registered:
+            try:
+                if enabled:
+                    self.drop_zone.drop_target_register(_dnd_files())
+                else:
+                    self.drop_zone.drop_target_unregister()
+            except:
+                pass  # DND state change failed
+                
+        self.drop_text.configure(text=self.drop_prompt if enabled else "File selection is locked while processing")
+        
+        # Apply a drop that finished scanning during processing
+        if enabled and self._held_drop:
+            held, self._held_drop = self._held_drop, []
+            self._add_videos(held)
+        
     def _on_hover_enter(self, event):
         """Handle mouse enter on drop zone"""
         self.drop_zone.configure(
@@ -209,19 +326,40 @@ class FilePicker(ctk.CTkFrame):
         
     def _on_drop(self, event):
         """Handle file drop"""
-        if not DND_AVAILABLE:
-            return
+        # Parse dropped files (Tcl list: paths with spaces are wrapped in braces)
+        files = [m.group(1) if m.group(1) is not None else m.group(2) for m in _DROP_RE.finditer(event.data)]
+        files = [f for f in files if f]
             
-        # Parse dropped files
+        # Scan dropped folders off the UI thread
+        self.drop_text.configure(text="Scanning…")
+        threading.Thread(target=self._scan_dropped, args=(files,), daemon=True).start()
+        
+    def _scan_dropped(self, files):
+        """Resolve dropped paths to video files (background thread, no Tk calls)"""
+        videos = []
         try:
-            files = self.winfo_toplevel().tk.splitlist(event.data)
-        except:
-            files = event.data.split()
-            
-        self._add_files(files)
+            videos = self._collect_videos(files)
+        except Exception as e:
+            print(f"Error scanning dropped files: {e}")
+        finally:
+            # Always post back so the drop zone leaves "Scanning…"
+            self.after(0, self._finish_drop, videos)
+        
+    def _finish_drop(self, videos: List[Path]):
+        """Add scanned videos to the selection (main thread)"""
+        if not self.enabled:
+            # Processing started mid-scan: keep the locked message and the selection
+            # the run is using; the drop is applied once selection unlocks
+            self._held_drop.extend(videos)
+            return
+        self.drop_text.configure(text=self.drop_prompt)
+        self._add_videos(videos)
         
     def browse_files(self):
         """Open file browser dialog"""
+        if not self.enabled:
+            return
+            
         filetypes = [
             ("Video files", "*.mp4 *.avi *.mov *.mkv *.flv *.wmv *.webm"),
             ("All files", "*.*")
@@ -243,19 +381,50 @@ class FilePicker(ctk.CTkFrame):
             self._add_files(files)
             
     def _add_files(self, files):
-        """Add files to selection"""
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm'}
+        """Add files to selection (folders add the videos inside them)"""
+        self._add_videos(self._collect_videos(files))
         
+    def _collect_videos(self, files) -> List[Path]:
+        """Resolve files and folders to the video files they contain"""
+        videos = []
         for file in files:
             path = Path(file)
-            if path.suffix.lower() in video_extensions and path not in self.selected_files:
-                self.selected_files.append(path)
+            if path.is_dir():
+                videos.extend(self._get_videos(path))
+            elif path.suffix.lower() in VIDEO_EXTS:
+                videos.append(path)
+        return videos
+        
+    def _add_videos(self, videos: List[Path]):
+        """Append new videos to the selection and refresh the list"""
+        existing = set(self.selected_files)
+        for video in videos:
+            if video not in existing:
+                existing.add(video)
+                self.selected_files.append(video)
                 
         self._update_file_list()
         self._notify_change()
         
+    def _get_videos(self, directory: Path) -> List[Path]:
+        """Videos under a directory, reusing the last scan if the folder is unchanged"""
+        try:
+            mtime = directory.stat().st_mtime
+        except OSError:
+            return []
+            
+        cached = self._scan_cache.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+            
+        videos = _scan_videos(directory)
+        self._scan_cache[directory] = (mtime, videos)
+        return videos
+        
     def _remove_file(self, filepath: Path):
         """Remove file from selection"""
+        if not self.enabled:
+            return
         if filepath in self.selected_files:
             self.selected_files.remove(filepath)
         self._update_file_list()
@@ -263,20 +432,9 @@ class FilePicker(ctk.CTkFrame):
         
     def _update_file_list(self):
         """Update file list display"""
-        # Clear existing cards
-        for card in self.file_cards:
-            card.destroy()
-        self.file_cards.clear()
-        
-        # Create new cards
-        for filepath in self.selected_files:
-            card = FileCard(
-                self.file_list_frame,
-                filepath=filepath,
-                on_remove=self._remove_file
-            )
-            card.pack(fill="x", pady=2)
-            self.file_cards.append(card)
+        # Rows still in view are re-pointed at their new file rather than rebuilt
+        self.file_canvas.configure(scrollregion=(0, 0, 0, len(self.selected_files) * self.ROW_HEIGHT))
+        self._render_visible()
             
         # Update count label
         count = len(self.selected_files)
@@ -287,6 +445,68 @@ class FilePicker(ctk.CTkFrame):
         else:
             self.count_label.configure(text=f"{count} files selected")
             
+    def _render_visible(self):
+        """Show cards for rows in view, reusing cards that scrolled away"""
+        count = len(self.selected_files)
+        height = max(self.file_canvas.winfo_height(), 1)
+        width = self.file_canvas.winfo_width()
+        
+        first = max(0, int(self.file_canvas.canvasy(0) // self.ROW_HEIGHT) - self.ROW_BUFFER)
+        last = min(count, first + height // self.ROW_HEIGHT + 1 + 2 * self.ROW_BUFFER)
+        visible = range(first, last)
+        
+        # Hide rows that left the view and keep them for reuse
+        for index in [i for i in self._rendered if i not in visible]:
+            card, window = self._rendered.pop(index)
+            self.file_canvas.itemconfigure(window, state="hidden")
+            self._spare_rows.append((card, window))
+            
+        for index in visible:
+            filepath = self.selected_files[index]
+            if index in self._rendered:
+                card, _ = self._rendered[index]
+                if card.filepath != filepath:
+                    card.set_file(filepath)
+                continue
+                
+            y = index * self.ROW_HEIGHT + 2
+            if self._spare_rows:
+                card, window = self._spare_rows.pop()
+                card.set_file(filepath)
+                self.file_canvas.coords(window, 0, y)
+                self.file_canvas.itemconfigure(window, state="normal", width=width)
+            else:
+                card = FileCard(
+                    self.file_canvas,
+                    filepath=filepath,
+                    on_remove=self._remove_file
+                )
+                bind_mousewheel(card, self._on_list_wheel)
+                window = self.file_canvas.create_window(
+                    0, y,
+                    window=card,
+                    anchor="nw",
+                    width=width,
+                    height=self.ROW_HEIGHT - 4
+                )
+            self._rendered[index] = (card, window)
+            
+    def _on_list_scroll(self, *args):
+        """Scrollbar moved the list"""
+        self.file_canvas.yview(*args)
+        self._render_visible()
+        
+    def _on_list_resize(self, event):
+        """Keep rows as wide as the canvas and fill newly exposed space"""
+        for _, window in self._rendered.values():
+            self.file_canvas.itemconfigure(window, width=event.width)
+        self._render_visible()
+        
+    def _on_list_wheel(self, step: int):
+        """Scroll the list with the mouse wheel while the pointer is over it"""
+        self.file_canvas.yview_scroll(step, "units")
+        self._render_visible()
+        
     def _notify_change(self):
         """Notify parent of file selection change"""
         if self.on_files_changed:
@@ -299,6 +519,7 @@ class FilePicker(ctk.CTkFrame):
     def clear(self):
         """Clear all selected files"""
         self.selected_files.clear()
+        self._scan_cache.clear()
         self._update_file_list()
         self._notify_change()
 
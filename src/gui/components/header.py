@@ -30,80 +30,85 @@ class Header(ctk.CTkFrame):
         
     def _create_widgets(self):
         """Create header widgets"""
+        c = theme.colors
+        sp = theme.spacing
+        CTkLabel = ctk.CTkLabel
+        CTkFrame = ctk.CTkFrame
+        
         # Left section - Logo and title
-        left_frame = ctk.CTkFrame(self, fg_color="transparent")
-        left_frame.pack(side="left", fill="y", padx=theme.spacing.lg)
+        left_frame = CTkFrame(self, fg_color="transparent")
+        left_frame.pack(side="left", fill="y", padx=sp.lg)
         
         # Logo icon (using emoji for now, could be replaced with image)
-        logo_label = ctk.CTkLabel(
+        logo_label = CTkLabel(
             left_frame,
             text="🎬",
             font=get_font("3xl"),
-            text_color=theme.colors.accent_primary
+            text_color=c.accent_primary
         )
-        logo_label.pack(side="left", padx=(0, theme.spacing.sm))
+        logo_label.pack(side="left", padx=(0, sp.sm))
         
         # Title
-        title_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
-        title_frame.pack(side="left", fill="y", pady=theme.spacing.sm)
+        title_frame = CTkFrame(left_frame, fg_color="transparent")
+        title_frame.pack(side="left", fill="y", pady=sp.sm)
         
-        title_label = ctk.CTkLabel(
+        title_label = CTkLabel(
             title_frame,
             text="LTW Video Editor Pro",
             font=get_font("xl", "bold"),
-            text_color=theme.colors.text_primary
+            text_color=c.text_primary
         )
         title_label.pack(anchor="w")
         
-        subtitle_label = ctk.CTkLabel(
+        subtitle_label = CTkLabel(
             title_frame,
             text="Professional Video Splitting & Editing Suite",
             font=get_font("xs"),
-            text_color=theme.colors.text_muted
+            text_color=c.text_muted
         )
         subtitle_label.pack(anchor="w")
         
         # Right section - Quick actions
-        right_frame = ctk.CTkFrame(self, fg_color="transparent")
-        right_frame.pack(side="right", fill="y", padx=theme.spacing.lg)
+        right_frame = CTkFrame(self, fg_color="transparent")
+        right_frame.pack(side="right", fill="y", padx=sp.lg)
         
         # Version badge
-        version_badge = ctk.CTkLabel(
+        version_badge = CTkLabel(
             right_frame,
             text="v2.0",
             font=get_font("xs"),
-            text_color=theme.colors.text_muted,
-            fg_color=theme.colors.bg_tertiary,
+            text_color=c.text_muted,
+            fg_color=c.bg_tertiary,
             corner_radius=4,
             padx=8,
             pady=2
         )
-        version_badge.pack(side="left", padx=theme.spacing.sm, pady=theme.spacing.md)
+        version_badge.pack(side="left", padx=sp.sm, pady=sp.md)
         
         # Status indicator
-        self.status_frame = ctk.CTkFrame(
+        self.status_frame = CTkFrame(
             right_frame,
-            fg_color=theme.colors.bg_tertiary,
+            fg_color=c.bg_tertiary,
             corner_radius=12,
             height=32,
             width=100
         )
-        self.status_frame.pack(side="left", padx=theme.spacing.sm, pady=theme.spacing.md)
+        self.status_frame.pack(side="left", padx=sp.sm, pady=sp.md)
         
-        self.status_dot = ctk.CTkLabel(
+        self.status_dot = CTkLabel(
             self.status_frame,
             text="●",
             font=get_font("sm"),
-            text_color=theme.colors.success,
+            text_color=c.success,
             width=20
         )
         self.status_dot.pack(side="left", padx=(8, 0), pady=4)
         
-        self.status_text = ctk.CTkLabel(
+        self.status_text = CTkLabel(
             self.status_frame,
             text="Ready",
             font=get_font("sm"),
-            text_color=theme.colors.text_secondary
+            text_color=c.text_secondary
         )
         self.status_text.pack(side="left", padx=(4, 12), pady=4)
         
@@ -9,6 +9,19 @@ import os
 
 from ..theme import theme, get_font
 
+# Navigation items as (tab id, icon, label)
+_NAV_ITEMS = (
+    ("split", "✂️", "Video Splitter"),
+    ("opus", "🤖", "Opus Clip AI"),
+    ("resolve", "🎭", "DaVinci Resolve"),
+)
+
+# Invariant widget options, built once at import (fonts need a Tk root, so they stay per-call)
+_SECTION_LABEL_KW = {"text_color": theme.colors.text_muted}
+_SECTION_LABEL_GRID = {"row": 0, "column": 0, "sticky": "w", "pady": (0, theme.spacing.sm)}
+_SECTION_FRAME_GRID = {"column": 0, "sticky": "ew", "padx": theme.spacing.md}
+_NAV_BUTTON_GRID = {"column": 0, "sticky": "ew", "pady": 2}
+
 
 class NavButton(ctk.CTkButton):
     """Custom navigation button with icon and label"""
@@ -35,6 +48,8 @@ class NavButton(ctk.CTkButton):
         
     def set_active(self, active: bool):
         """Set button active state"""
+        if active == self._active:
+            return
         self._active = active
         style = theme.get_sidebar_button_style(active)
         self.configure(**style)
@@ -56,32 +71,35 @@ class Sidebar(ctk.CTkFrame):
         self.nav_buttons: Dict[str, NavButton] = {}
         self.current_tab = "split"
         
-        self.pack_propagate(False)
+        # Latest stats text waiting for the idle flush
+        self._pending_stats = None
+        self._stats_flush_scheduled = False
+        
+        self.grid_propagate(False)
         self._create_widgets()
         
     def _create_widgets(self):
         """Create sidebar widgets"""
+        # Fixed row layout: nav, separator, settings, flexible gap, stats
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(3, weight=1)
+        
         # Navigation section
         nav_frame = ctk.CTkFrame(self, fg_color="transparent")
-        nav_frame.pack(fill="x", padx=theme.spacing.md, pady=theme.spacing.lg)
+        nav_frame.grid(row=0, pady=theme.spacing.lg, **_SECTION_FRAME_GRID)
+        nav_frame.grid_columnconfigure(0, weight=1)
         
         # Section label
         section_label = ctk.CTkLabel(
             nav_frame,
             text="MAIN TOOLS",
             font=get_font("xs", "bold"),
-            text_color=theme.colors.text_muted
+            **_SECTION_LABEL_KW
         )
-        section_label.pack(anchor="w", pady=(0, theme.spacing.sm))
+        section_label.grid(**_SECTION_LABEL_GRID)
         
         # Navigation items
-        nav_items = [
-            ("split", "✂️", "Video Splitter"),
-            ("opus", "🤖", "Opus Clip AI"),
-            ("resolve", "🎭", "DaVinci Resolve"),
-        ]
-        
-        for tab_id, icon, label in nav_items:
+        for row, (tab_id, icon, label) in enumerate(_NAV_ITEMS, 1):
             btn = NavButton(
                 nav_frame,
                 icon=icon,
@@ -89,7 +107,7 @@ class Sidebar(ctk.CTkFrame):
                 active=(tab_id == self.current_tab),
                 command=lambda t=tab_id: self._on_nav_click(t)
             )
-            btn.pack(fill="x", pady=2)
+            btn.grid(row=row, **_NAV_BUTTON_GRID)
             self.nav_buttons[tab_id] = btn
         
         # Separator
@@ -98,19 +116,20 @@ class Sidebar(ctk.CTkFrame):
             fg_color=theme.colors.border_default,
             height=1
         )
-        separator.pack(fill="x", padx=theme.spacing.lg, pady=theme.spacing.lg)
+        separator.grid(row=1, column=0, sticky="ew", padx=theme.spacing.lg, pady=theme.spacing.lg)
         
         # Settings section
         settings_frame = ctk.CTkFrame(self, fg_color="transparent")
-        settings_frame.pack(fill="x", padx=theme.spacing.md)
+        settings_frame.grid(row=2, **_SECTION_FRAME_GRID)
+        settings_frame.grid_columnconfigure(0, weight=1)
         
         settings_label = ctk.CTkLabel(
             settings_frame,
             text="CONFIGURATION",
             font=get_font("xs", "bold"),
-            text_color=theme.colors.text_muted
+            **_SECTION_LABEL_KW
         )
-        settings_label.pack(anchor="w", pady=(0, theme.spacing.sm))
+        settings_label.grid(**_SECTION_LABEL_GRID)
         
         settings_btn = NavButton(
             settings_frame,
@@ -119,20 +138,16 @@ class Sidebar(ctk.CTkFrame):
             active=False,
             command=lambda: self._on_nav_click("settings")
         )
-        settings_btn.pack(fill="x", pady=2)
+        settings_btn.grid(row=1, **_NAV_BUTTON_GRID)
         self.nav_buttons["settings"] = settings_btn
         
-        # Spacer
-        spacer = ctk.CTkFrame(self, fg_color="transparent")
-        spacer.pack(fill="both", expand=True)
-        
-        # Bottom section - Quick stats
+        # Bottom section - Quick stats (row 3 is the flexible gap above it)
         stats_frame = ctk.CTkFrame(
             self,
             fg_color=theme.colors.bg_tertiary,
             corner_radius=theme.spacing.card_radius
         )
-        stats_frame.pack(fill="x", padx=theme.spacing.md, pady=theme.spacing.lg)
+        stats_frame.grid(row=4, column=0, sticky="ew", padx=theme.spacing.md, pady=theme.spacing.lg)
         
         stats_title = ctk.CTkLabel(
             stats_frame,
@@ -140,7 +155,7 @@ class Sidebar(ctk.CTkFrame):
             font=get_font("sm", "bold"),
             text_color=theme.colors.text_primary
         )
-        stats_title.pack(anchor="w", padx=theme.spacing.md, pady=(theme.spacing.md, theme.spacing.xs))
+        stats_title.grid(row=0, column=0, sticky="w", padx=theme.spacing.md, pady=(theme.spacing.md, theme.spacing.xs))
         
         self.stats_content = ctk.CTkLabel(
             stats_frame,
@@ -150,16 +165,18 @@ class Sidebar(ctk.CTkFrame):
             wraplength=180,
             justify="left"
         )
-        self.stats_content.pack(anchor="w", padx=theme.spacing.md, pady=(0, theme.spacing.md))
+        self.stats_content.grid(row=1, column=0, sticky="w", padx=theme.spacing.md, pady=(0, theme.spacing.md))
         
     def _on_nav_click(self, tab_id: str):
         """Handle navigation button click"""
         if tab_id == self.current_tab:
             return
             
-        # Update button states
-        for btn_id, btn in self.nav_buttons.items():
-            btn.set_active(btn_id == tab_id)
+        # Only the previously active and the newly active buttons change
+        if self.current_tab in self.nav_buttons:
+            self.nav_buttons[self.current_tab].set_active(False)
+        if tab_id in self.nav_buttons:
+            self.nav_buttons[tab_id].set_active(True)
         
         self.current_tab = tab_id
         
@@ -168,7 +185,16 @@ class Sidebar(ctk.CTkFrame):
             
     def update_stats(self, stats_text: str):
         """Update quick stats display"""
-        self.stats_content.configure(text=stats_text)
+        # Coalesce bursts so only the latest text is drawn once per idle cycle
+        self._pending_stats = stats_text
+        if not self._stats_flush_scheduled:
+            self._stats_flush_scheduled = True
+            self.after_idle(self._flush_stats)
+            
+    def _flush_stats(self):
+        """Apply the most recent pending stats text"""
+        self._stats_flush_scheduled = False
+        self.stats_content.configure(text=self._pending_stats)
         
     def set_active_tab(self, tab_id: str):
         """Programmatically set active tab"""
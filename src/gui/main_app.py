@@ -4,10 +4,11 @@ Professional video editing suite with sidebar navigation
 """
 
 import customtkinter as ctk
+import json
 import sys
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 
 # Add paths for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,91 +16,100 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from .theme import theme, get_font
 from .utils.preset_manager import Preset
 
+# Window geometry and tab settings persisted between launches
+SETTINGS_PATH = Path.home() / ".ltw_clipper" / "settings.json"
+
 
 class LTWVideoEditorPro:
     """Main application class"""
     
+    # Header labels as (text, font key, color, pack options); the last one is the status label
+    HEADER_LABELS = (
+        ("🎬", "logo", None, {"side": "left", "padx": 20}),
+        ("LTW Video Editor Pro", "title", "white", {"side": "left", "padx": 10}),
+        ("● Ready", "status", "#00d26a", {"side": "right", "padx": 20}),
+    )
+    SECTION_PACK = {"anchor": "w", "padx": 16, "pady": (20, 10)}
+    NAV_ITEMS = (
+        ("split", "✂️  Video Splitter"),
+        ("opus", "🤖  Opus Clip AI"),
+        ("resolve", "🎭  DaVinci Resolve"),
+    )
+    
     def __init__(self):
         # Apply theme first
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
+        # Restore last session's settings
+        saved = self._load_saved_settings()
+        
         # Create main window
         self.root = ctk.CTk()
         self.root.title("LTW Video Editor Pro")
-        self.root.geometry("1200x800")
+        self.root.geometry(saved.get("geometry") or self._centered_geometry(1200, 800))
         self.root.minsize(1000, 700)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Shared fonts (Tk fonts need a root window, so build them after it)
+        self.F = {
+            "logo": ctk.CTkFont(size=32),
+            "title": ctk.CTkFont(size=20, weight="bold"),
+            "nav": ctk.CTkFont(size=14),
+            "status": ctk.CTkFont(size=12),
+            "section": ctk.CTkFont(size=10, weight="bold"),
+        }
         
         # Track current tab
         self.current_tab = "split"
         self.tabs: Dict[str, ctk.CTkFrame] = {}
+        # Settings for tabs not built yet, applied when they are first shown
+        self._pending_settings: Dict[str, Dict[str, Any]] = {}
         
         self._create_layout()
-        self._center_window()
+        
+        if saved.get("settings"):
+            self._apply_tab_settings("split", saved["settings"])
+            self._apply_tab_settings("opus", saved["settings"])
         
     def _create_layout(self):
         """Create the main layout"""
+        F = self.F
+        CTkFrame = ctk.CTkFrame
+        CTkButton = ctk.CTkButton
+        
         # Main horizontal container
-        main_frame = ctk.CTkFrame(self.root, fg_color="#13131f")
+        main_frame = CTkFrame(self.root, fg_color="#13131f")
         main_frame.pack(fill="both", expand=True)
         
         # === HEADER ===
-        header = ctk.CTkFrame(main_frame, fg_color="#1a1a2e", height=60)
+        header = CTkFrame(main_frame, fg_color="#1a1a2e", height=60)
         header.pack(fill="x", side="top")
         header.pack_propagate(False)
         
-        # Logo and title
-        logo = ctk.CTkLabel(header, text="🎬", font=ctk.CTkFont(size=32))
-        logo.pack(side="left", padx=20)
-        
-        title = ctk.CTkLabel(
-            header, 
-            text="LTW Video Editor Pro", 
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color="white"
-        )
-        title.pack(side="left", padx=10)
-        
-        # Status
-        self.status_label = ctk.CTkLabel(
-            header,
-            text="● Ready",
-            font=ctk.CTkFont(size=12),
-            text_color="#00d26a"
-        )
-        self.status_label.pack(side="right", padx=20)
+        # Logo, title and status
+        for text, font_key, color, pack in self.HEADER_LABELS:
+            self.status_label = self._mklabel(header, text, font_key, color, **pack)
         
         # === BODY (Sidebar + Content) ===
-        body = ctk.CTkFrame(main_frame, fg_color="transparent")
+        body = CTkFrame(main_frame, fg_color="transparent")
         body.pack(fill="both", expand=True, side="top")
         
         # === SIDEBAR ===
-        sidebar = ctk.CTkFrame(body, fg_color="#1a1a2e", width=220)
+        sidebar = CTkFrame(body, fg_color="#1a1a2e", width=220)
         sidebar.pack(fill="y", side="left")
         sidebar.pack_propagate(False)
         
         # Sidebar title
-        nav_label = ctk.CTkLabel(
-            sidebar,
-            text="MAIN TOOLS",
-            font=ctk.CTkFont(size=10, weight="bold"),
-            text_color="#6b6b80"
-        )
-        nav_label.pack(anchor="w", padx=16, pady=(20, 10))
+        self._mklabel(sidebar, "MAIN TOOLS", "section", "#6b6b80", **self.SECTION_PACK)
         
         # Navigation buttons
-        nav_items = [
-            ("split", "✂️  Video Splitter"),
-            ("opus", "🤖  Opus Clip AI"),
-            ("resolve", "🎭  DaVinci Resolve"),
-        ]
-        
         self.nav_buttons = {}
-        for tab_id, label in nav_items:
-            btn = ctk.CTkButton(
+        for tab_id, label in self.NAV_ITEMS:
+            btn = CTkButton(
                 sidebar,
                 text=label,
-                font=ctk.CTkFont(size=14),
+                font=F["nav"],
                 height=44,
                 anchor="w",
                 fg_color="#0066ff" if tab_id == "split" else "transparent",
@@ -110,18 +120,12 @@ class LTWVideoEditorPro:
             self.nav_buttons[tab_id] = btn
         
         # Settings section
-        settings_label = ctk.CTkLabel(
-            sidebar,
-            text="CONFIGURATION",
-            font=ctk.CTkFont(size=10, weight="bold"),
-            text_color="#6b6b80"
-        )
-        settings_label.pack(anchor="w", padx=16, pady=(20, 10))
+        self._mklabel(sidebar, "CONFIGURATION", "section", "#6b6b80", **self.SECTION_PACK)
         
-        settings_btn = ctk.CTkButton(
+        settings_btn = CTkButton(
             sidebar,
             text="⚙️  Settings",
-            font=ctk.CTkFont(size=14),
+            font=F["nav"],
             height=44,
             anchor="w",
             fg_color="transparent",
@@ -132,7 +136,7 @@ class LTWVideoEditorPro:
         self.nav_buttons["settings"] = settings_btn
         
         # === CONTENT AREA ===
-        self.content_area = ctk.CTkFrame(body, fg_color="#0d0d14")
+        self.content_area = CTkFrame(body, fg_color="#0d0d14")
         self.content_area.pack(fill="both", expand=True, side="right")
         
         # Create tabs
@@ -141,50 +145,70 @@ class LTWVideoEditorPro:
         # Show initial tab
         self._show_tab("split")
         
+    def _mklabel(self, parent, text: str, font_key: str, color: Optional[str] = None, **pack) -> ctk.CTkLabel:
+        """Create and pack a label using a registry font"""
+        options = {"text_color": color} if color else {}
+        label = ctk.CTkLabel(parent, text=text, font=self.F[font_key], **options)
+        label.pack(**pack)
+        return label
+        
     def _create_tabs(self):
-        """Create all tab contents"""
-        # Import tabs here to avoid circular imports
-        from .tabs.split_tab import SplitTab
-        from .tabs.opus_tab import OpusTab
-        from .tabs.resolve_tab import ResolveTab
-        from .tabs.settings_tab import SettingsTab
-        
-        # Split Tab
-        self.tabs["split"] = SplitTab(
-            self.content_area,
-            on_status_change=self._on_status_change,
-            on_stats_update=lambda x: None
-        )
+        """Register tab factories; each tab is built the first time it is shown"""
+        # Import tabs here to avoid circular imports (the package loads each tab module on first access)
+        from . import tabs
         
-        # Opus Clip Tab
-        self.tabs["opus"] = OpusTab(
-            self.content_area,
-            on_status_change=self._on_status_change,
-            on_stats_update=lambda x: None
-        )
+        self._tab_factories: Dict[str, Callable[[], ctk.CTkFrame]] = {
+            # Split Tab
+            "split": lambda: tabs.SplitTab(
+                self.content_area,
+                on_status_change=self._on_status_change,
+                on_stats_update=lambda x: None
+            ),
+            # Opus Clip Tab
+            "opus": lambda: tabs.OpusTab(
+                self.content_area,
+                on_status_change=self._on_status_change,
+                on_stats_update=lambda x: None
+            ),
+            # Resolve Tab
+            "resolve": lambda: tabs.ResolveTab(
+                self.content_area,
+                on_status_change=self._on_status_change
+            ),
+            # Settings Tab
+            "settings": lambda: tabs.SettingsTab(
+                self.content_area,
+                on_preset_apply=self._on_preset_apply,
+                get_current_settings=self._get_current_settings,
+                on_status_change=self._on_status_change
+            ),
+        }
         
-        # Resolve Tab
-        self.tabs["resolve"] = ResolveTab(
-            self.content_area,
-            on_status_change=self._on_status_change
-        )
-        
-        # Settings Tab
-        self.tabs["settings"] = SettingsTab(
-            self.content_area,
-            on_preset_apply=self._on_preset_apply,
-            get_current_settings=self._get_current_settings,
-            on_status_change=self._on_status_change
-        )
+    def _get_tab(self, tab_id: str) -> Optional[ctk.CTkFrame]:
+        """Return a tab, building it (and applying pending settings) on first use"""
+        tab = self.tabs.get(tab_id)
+        if tab is None and tab_id in self._tab_factories:
+            tab = self._tab_factories[tab_id]()
+            self.tabs[tab_id] = tab
+            if tab_id in self._pending_settings:
+                tab.apply_settings(self._pending_settings.pop(tab_id))
+        return tab
         
+    def _apply_tab_settings(self, tab_id: str, settings: Dict[str, Any]):
+        """Apply settings now if the tab exists, otherwise when it is built"""
+        if tab_id in self.tabs:
+            self.tabs[tab_id].apply_settings(settings)
+        else:
+            self._pending_settings.setdefault(tab_id, {}).update(settings)
+            
     def _switch_tab(self, tab_id: str):
         """Switch to a different tab"""
-        # Update button states
-        for btn_id, btn in self.nav_buttons.items():
-            if btn_id == tab_id:
-                btn.configure(fg_color="#0066ff", hover_color="#0052cc")
-            else:
-                btn.configure(fg_color="transparent", hover_color="#2d2d44")
+        # Only the previously active and the newly active buttons change
+        if tab_id != self.current_tab:
+            if self.current_tab in self.nav_buttons:
+                self.nav_buttons[self.current_tab].configure(fg_color="transparent", hover_color="#2d2d44")
+            if tab_id in self.nav_buttons:
+                self.nav_buttons[tab_id].configure(fg_color="#0066ff", hover_color="#0052cc")
         
         self._show_tab(tab_id)
         
@@ -195,8 +219,9 @@ class LTWVideoEditorPro:
             tab.pack_forget()
             
         # Show selected tab
-        if tab_id in self.tabs:
-            self.tabs[tab_id].pack(fill="both", expand=True)
+        tab = self._get_tab(tab_id)
+        if tab is not None:
+            tab.pack(fill="both", expand=True)
             self.current_tab = tab_id
             
     def _on_status_change(self, status: str, status_type: str = "success"):
@@ -216,27 +241,50 @@ class LTWVideoEditorPro:
     def _on_preset_apply(self, preset: Preset):
         """Apply a preset to the split tab"""
         settings = preset.to_dict()
-        self.tabs["split"].apply_settings(settings)
-        self.tabs["opus"].apply_settings(settings)
+        self._apply_tab_settings("split", settings)
+        self._apply_tab_settings("opus", settings)
         self._switch_tab("split")
         
     def _get_current_settings(self) -> Dict[str, Any]:
         """Get current settings from all tabs"""
         settings = {}
-        if "split" in self.tabs:
-            settings.update(self.tabs["split"].get_settings())
-        if "opus" in self.tabs:
-            settings.update(self.tabs["opus"].get_settings())
+        # Unbuilt tabs report what they will apply; live tabs take precedence
+        for tab_id in ("split", "opus"):
+            if tab_id not in self.tabs:
+                settings.update(self._pending_settings.get(tab_id, {}))
+        for tab_id in ("split", "opus"):
+            if tab_id in self.tabs:
+                settings.update(self.tabs[tab_id].get_settings())
         return settings
         
-    def _center_window(self):
-        """Center the window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f'{width}x{height}+{x}+{y}')
+    def _load_saved_settings(self) -> Dict[str, Any]:
+        """Load settings saved on the last close"""
+        try:
+            if SETTINGS_PATH.exists():
+                with open(SETTINGS_PATH, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Warning: Failed to load saved settings: {e}")
+        return {}
+        
+    def _on_close(self):
+        """Save settings and window geometry, then close"""
+        try:
+            SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(SETTINGS_PATH, 'w') as f:
+                json.dump({
+                    "geometry": self.root.geometry(),
+                    "settings": self._get_current_settings()
+                }, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Failed to save settings: {e}")
+        self.root.destroy()
+        
+    def _centered_geometry(self, width: int, height: int) -> str:
+        """Geometry string centering a window of the given size (no layout pass needed)"""
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
+        return f'{width}x{height}+{x}+{y}'
         
     def run(self):
         """Start the application"""
@@ -3,10 +3,22 @@ LTW Video Editor Pro - Feature Tabs
 Individual tab components for each feature area
 """
 
-from .split_tab import SplitTab
-from .opus_tab import OpusTab
-from .resolve_tab import ResolveTab
-from .settings_tab import SettingsTab
+import importlib
+
+# Tab classes are imported on first access (PEP 562) so unused tabs cost nothing at startup
+_TAB_MODULES = {
+    'SplitTab': '.split_tab',
+    'OpusTab': '.opus_tab',
+    'ResolveTab': '.resolve_tab',
+    'SettingsTab': '.settings_tab',
+}
 
 __all__ = ['SplitTab', 'OpusTab', 'ResolveTab', 'SettingsTab']
 
+
+def __getattr__(name):
+    if name in _TAB_MODULES:
+        value = getattr(importlib.import_module(_TAB_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,79 +8,149 @@ from tkinter import filedialog, messagebox
 from typing import Callable, Optional, List, Dict, Any
 from pathlib import Path
 import threading
+import queue
 import sys
 import os
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor
 
 from ..theme import theme, get_font
 from ..components.file_picker import FilePicker
 from ..components.progress_card import ProgressCard, StageStatus
 
+# Target platforms as (name, icon, aspect ratio)
+_PLATFORMS = (
+    ("TikTok", "📱", "9:16"),
+    ("Instagram Reels", "📷", "9:16"),
+    ("YouTube Shorts", "▶️", "9:16"),
+    ("Twitter", "🐦", "1:1"),
+    ("LinkedIn", "💼", "16:9"),
+)
+_PLATFORM_NAMES = tuple(name for name, _, _ in _PLATFORMS)
+_PLATFORM_INDEX = {name: i for i, name in enumerate(_PLATFORM_NAMES)}
+_DEFAULT_PLATFORMS = frozenset({"TikTok", "Instagram Reels", "YouTube Shorts"})
+
+# Processing stages reported by the worker
+_STAGES = (
+    "Analyzing content...",
+    "Detecting highlights...",
+    "Generating clips...",
+    "Optimizing for platforms...",
+    "Exporting final clips...",
+)
+
+
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+_PLATFORM_KEY_CACHE: Dict[str, str] = {}
+
+
+def _platform_key(platform: str) -> str:
+    """Normalize a platform name for matching ("YouTube Shorts" -> "youtube_shorts")"""
+    key = _PLATFORM_KEY_CACHE.get(platform)
+    if key is None:
+        key = _PLATFORM_KEY_CACHE[platform] = platform.translate(_SPACE_TO_UNDERSCORE).lower()
+    return key
+
+
+# Normalized keys parallel to _PLATFORM_NAMES
+_PLATFORM_KEYS = tuple(_platform_key(name) for name in _PLATFORM_NAMES)
+
+
+# PlatformCard background indexed by selection state
+_PLATFORM_FG = (theme.colors.bg_tertiary, theme.colors.accent_primary)
+
+# Invariant widget options, built once at import (fonts need a Tk root, so they stay per-call)
+_CARD_KW = {"fg_color": theme.colors.bg_secondary, "corner_radius": theme.spacing.card_radius}
+_CARD_TITLE_PACK = {"anchor": "w", "padx": theme.spacing.lg, "pady": (theme.spacing.lg, theme.spacing.sm)}
+_CHECK_KW = {"fg_color": theme.colors.accent_primary, "hover_color": theme.colors.accent_hover}
+_DESC_PACK = {"anchor": "w", "padx": (26, 0), "pady": (0, theme.spacing.md)}
+_PLATFORM_GRID = {"row": 0, "padx": (0, theme.spacing.sm)}
+_TEXT_PRIMARY = {"text_color": theme.colors.text_primary}
+_TEXT_SECONDARY = {"text_color": theme.colors.text_secondary}
+_TEXT_MUTED = {"text_color": theme.colors.text_muted}
+
 
 class PlatformCard(ctk.CTkFrame):
     """Selectable platform card"""
     
+    # Every widget inside a card carries this bindtag; one class binding handles all clicks
+    BIND_TAG = "PlatformCardClick"
+    _click_bound = False
+    
     def __init__(self, parent, platform: str, icon: str, aspect: str,
                  selected: bool = False, on_toggle: Optional[Callable] = None, **kwargs):
         super().__init__(
             parent,
-            fg_color=theme.colors.bg_tertiary if not selected else theme.colors.accent_primary,
+            fg_color=_PLATFORM_FG[selected],
             corner_radius=8,
             cursor="hand2",
             **kwargs
         )
         
         self.platform = platform
-        self.selected = selected
+        self.selected = bool(selected)
         self.on_toggle = on_toggle
         
-        self.bind("<Button-1>", self._on_click)
-        
-        # Content
-        content = ctk.CTkFrame(self, fg_color="transparent")
-        content.pack(padx=theme.spacing.md, pady=theme.spacing.sm)
-        content.bind("<Button-1>", self._on_click)
+        # Content, gridded straight into the card (no inner padding frame)
+        self.grid_columnconfigure(0, weight=1)
         
         icon_label = ctk.CTkLabel(
-            content,
+            self,
             text=icon,
             font=get_font("xl")
         )
-        icon_label.pack()
-        icon_label.bind("<Button-1>", self._on_click)
+        icon_label.grid(row=0, column=0, padx=theme.spacing.md, pady=(theme.spacing.sm, 0))
         
         name_label = ctk.CTkLabel(
-            content,
+            self,
             text=platform,
             font=get_font("sm", "bold"),
-            text_color=theme.colors.text_primary
+            **_TEXT_PRIMARY
         )
-        name_label.pack()
-        name_label.bind("<Button-1>", self._on_click)
+        name_label.grid(row=1, column=0, padx=theme.spacing.md)
         
         aspect_label = ctk.CTkLabel(
-            content,
+            self,
             text=aspect,
             font=get_font("xs"),
-            text_color=theme.colors.text_muted
+            **_TEXT_MUTED
         )
-        aspect_label.pack()
-        aspect_label.bind("<Button-1>", self._on_click)
-        
+        aspect_label.grid(row=2, column=0, padx=theme.spacing.md, pady=(0, theme.spacing.sm))
+        
+        if not PlatformCard._click_bound:
+            self.bind_class(self.BIND_TAG, "<Button-1>", PlatformCard._dispatch_click)
+            PlatformCard._click_bound = True
+        self._add_bindtag(self)
+        
+    def _add_bindtag(self, widget):
+        """Tag a widget and its internal Tk children for the shared click binding"""
+        widget.bindtags((self.BIND_TAG,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_bindtag(child)
+            
+    @classmethod
+    def _dispatch_click(cls, event):
+        """Route a click on any tagged widget to its owning card"""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, cls):
+            widget = getattr(widget, "master", None)
+        if widget is not None:
+            widget._on_click(event)
+            
     def _on_click(self, event):
         """Handle click"""
         self.selected = not self.selected
-        self.configure(
-            fg_color=theme.colors.accent_primary if self.selected else theme.colors.bg_tertiary
-        )
+        self.configure(fg_color=_PLATFORM_FG[self.selected])
         if self.on_toggle:
             self.on_toggle(self.platform, self.selected)
             
     def set_selected(self, selected: bool):
         """Set selection state"""
+        selected = bool(selected)
+        if selected == self.selected:
+            return
         self.selected = selected
-        self.configure(
-            fg_color=theme.colors.accent_primary if selected else theme.colors.bg_tertiary
-        )
+        self.configure(fg_color=_PLATFORM_FG[selected])
 
 
 class OpusTab(ctk.CTkFrame):
@@ -98,24 +168,34 @@ class OpusTab(ctk.CTkFrame):
         self.on_stats_update = on_stats_update
         self.is_processing = False
         self.selected_files: List[Path] = []
-        self.selected_platforms: Dict[str, bool] = {
-            "TikTok": True,
-            "Instagram Reels": True,
-            "YouTube Shorts": True,
-            "Twitter": False,
-            "LinkedIn": False
-        }
+        # Selection flags parallel to _PLATFORM_NAMES
+        self._platform_selected: List[bool] = [name in _DEFAULT_PLATFORMS for name in _PLATFORM_NAMES]
+        
+        # Slider label updates are coalesced until Tk is idle
+        self._pending_clips = 10
+        self._clips_update_id = None
+        
+        # One reusable worker thread for processing jobs, stopped through an Event
+        # (a fresh one per run, so a stopped job that hasn't noticed yet stays stopped)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="opus")
+        self._cancel = threading.Event()
+        
+        # Worker progress is queued and drained by a 50 ms poller on the main thread
+        self._progress_q: queue.Queue = queue.Queue()
+        self._poll_id = None
+        
+        # Stage currently shown in progress, so updates only touch stages that changed
+        self._active_stage = -1
         
         self._create_widgets()
         
     def _create_widgets(self):
         """Create tab widgets"""
-        # Scrollable container
+        # Scrollable container (packed once every child exists, so layout runs once)
         self.scroll_frame = ctk.CTkScrollableFrame(
             self,
             fg_color="transparent"
         )
-        self.scroll_frame.pack(fill="both", expand=True, padx=theme.spacing.lg, pady=theme.spacing.lg)
         
         # Header
         header = ctk.CTkFrame(self.scroll_frame, fg_color="transparent")
@@ -140,8 +220,7 @@ class OpusTab(ctk.CTkFrame):
         # File Selection
         file_card = ctk.CTkFrame(
             self.scroll_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=theme.spacing.card_radius
+            **_CARD_KW
         )
         file_card.pack(fill="x", pady=(0, theme.spacing.lg))
         
@@ -149,9 +228,9 @@ class OpusTab(ctk.CTkFrame):
             file_card,
             text="📁  Source Video",
             font=get_font("md", "bold"),
-            text_color=theme.colors.text_primary
+            **_TEXT_PRIMARY
         )
-        file_title.pack(anchor="w", padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.sm))
+        file_title.pack(**_CARD_TITLE_PACK)
         
         self.file_picker = FilePicker(
             file_card,
@@ -163,8 +242,7 @@ class OpusTab(ctk.CTkFrame):
         # Platform Selection
         platform_card = ctk.CTkFrame(
             self.scroll_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=theme.spacing.card_radius
+            **_CARD_KW
         )
         platform_card.pack(fill="x", pady=(0, theme.spacing.lg))
         
@@ -172,15 +250,15 @@ class OpusTab(ctk.CTkFrame):
             platform_card,
             text="📱  Target Platforms",
             font=get_font("md", "bold"),
-            text_color=theme.colors.text_primary
+            **_TEXT_PRIMARY
         )
-        platform_title.pack(anchor="w", padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.sm))
+        platform_title.pack(**_CARD_TITLE_PACK)
         
         platform_desc = ctk.CTkLabel(
             platform_card,
             text="Select platforms to optimize clips for",
             font=get_font("sm"),
-            text_color=theme.colors.text_secondary
+            **_TEXT_SECONDARY
         )
         platform_desc.pack(anchor="w", padx=theme.spacing.lg)
         
@@ -188,33 +266,24 @@ class OpusTab(ctk.CTkFrame):
         platform_grid = ctk.CTkFrame(platform_card, fg_color="transparent")
         platform_grid.pack(fill="x", padx=theme.spacing.lg, pady=theme.spacing.lg)
         
-        platforms = [
-            ("TikTok", "📱", "9:16"),
-            ("Instagram Reels", "📷", "9:16"),
-            ("YouTube Shorts", "▶️", "9:16"),
-            ("Twitter", "🐦", "1:1"),
-            ("LinkedIn", "💼", "16:9")
-        ]
-        
         self.platform_cards: Dict[str, PlatformCard] = {}
         
-        for platform, icon, aspect in platforms:
+        for column, (platform, icon, aspect) in enumerate(_PLATFORMS):
             card = PlatformCard(
                 platform_grid,
                 platform=platform,
                 icon=icon,
                 aspect=aspect,
-                selected=self.selected_platforms.get(platform, False),
+                selected=self._platform_selected[column],
                 on_toggle=self._on_platform_toggle
             )
-            card.pack(side="left", padx=(0, theme.spacing.sm))
+            card.grid(column=column, **_PLATFORM_GRID)
             self.platform_cards[platform] = card
             
         # AI Settings
         ai_card = ctk.CTkFrame(
             self.scroll_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=theme.spacing.card_radius
+            **_CARD_KW
         )
         ai_card.pack(fill="x", pady=(0, theme.spacing.lg))
         
@@ -222,7 +291,7 @@ class OpusTab(ctk.CTkFrame):
             ai_card,
             text="✨  AI Features",
             font=get_font("md", "bold"),
-            text_color=theme.colors.text_primary
+            **_TEXT_PRIMARY
         )
         ai_title.pack(anchor="w", padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.md))
         
@@ -236,8 +305,7 @@ class OpusTab(ctk.CTkFrame):
             text="AI Highlight Detection",
             variable=self.ai_highlights_var,
             font=get_font("sm"),
-            fg_color=theme.colors.accent_primary,
-            hover_color=theme.colors.accent_hover
+            **_CHECK_KW
         )
         ai_check.pack(anchor="w", pady=(0, theme.spacing.sm))
         
@@ -245,9 +313,9 @@ class OpusTab(ctk.CTkFrame):
             ai_content,
             text="Automatically detect and extract the best moments",
             font=get_font("xs"),
-            text_color=theme.colors.text_muted
+            **_TEXT_MUTED
         )
-        ai_desc.pack(anchor="w", padx=(26, 0), pady=(0, theme.spacing.md))
+        ai_desc.pack(**_DESC_PACK)
         
         # Captions
         self.captions_var = ctk.BooleanVar(value=False)
@@ -256,8 +324,7 @@ class OpusTab(ctk.CTkFrame):
             text="Auto-Generate Captions",
             variable=self.captions_var,
             font=get_font("sm"),
-            fg_color=theme.colors.accent_primary,
-            hover_color=theme.colors.accent_hover
+            **_CHECK_KW
         )
         caption_check.pack(anchor="w", pady=(0, theme.spacing.sm))
         
@@ -265,9 +332,9 @@ class OpusTab(ctk.CTkFrame):
             ai_content,
             text="Add subtitles using speech-to-text (requires Whisper)",
             font=get_font("xs"),
-            text_color=theme.colors.text_muted
+            **_TEXT_MUTED
         )
-        caption_desc.pack(anchor="w", padx=(26, 0), pady=(0, theme.spacing.md))
+        caption_desc.pack(**_DESC_PACK)
         
         # Enhancement preset
         enhance_frame = ctk.CTkFrame(ai_content, fg_color="transparent")
@@ -277,7 +344,7 @@ class OpusTab(ctk.CTkFrame):
             enhance_frame,
             text="Enhancement Preset",
             font=get_font("sm"),
-            text_color=theme.colors.text_secondary
+            **_TEXT_SECONDARY
         )
         enhance_label.pack(anchor="w")
         
@@ -302,7 +369,7 @@ class OpusTab(ctk.CTkFrame):
             clips_frame,
             text="Maximum Clips to Generate",
             font=get_font("sm"),
-            text_color=theme.colors.text_secondary
+            **_TEXT_SECONDARY
         )
         clips_label.pack(anchor="w")
         
@@ -370,17 +437,26 @@ class OpusTab(ctk.CTkFrame):
         )
         self.stop_btn.pack(fill="x")
         
+        self.scroll_frame.pack(fill="both", expand=True, padx=theme.spacing.lg, pady=theme.spacing.lg)
+        
     def _on_files_changed(self, files: List[Path]):
         """Handle file selection"""
         self.selected_files = files
         
     def _on_platform_toggle(self, platform: str, selected: bool):
         """Handle platform toggle"""
-        self.selected_platforms[platform] = selected
+        self._platform_selected[_PLATFORM_INDEX[platform]] = selected
         
     def _on_clips_change(self, value):
-        """Handle clips slider change"""
-        self.clips_value.configure(text=str(int(value)))
+        """Handle clips slider change (label update coalesced to the next idle)"""
+        self._pending_clips = int(value)
+        if self._clips_update_id is None:
+            self._clips_update_id = self.after_idle(self._flush_clips_label)
+            
+    def _flush_clips_label(self):
+        """Show the latest slider value"""
+        self._clips_update_id = None
+        self.clips_value.configure(text=str(self._pending_clips))
         
     def _start_processing(self):
         """Start AI processing"""
@@ -388,12 +464,14 @@ class OpusTab(ctk.CTkFrame):
             messagebox.showwarning("No File", "Please select a video file first")
             return
             
-        selected = [p for p, s in self.selected_platforms.items() if s]
+        selected = self._selected_platform_names()
         if not selected:
             messagebox.showwarning("No Platforms", "Please select at least one target platform")
             return
             
         self.is_processing = True
+        self._cancel = threading.Event()
+        self._active_stage = -1
         self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
         self.progress_card.start_processing()
@@ -401,51 +479,71 @@ class OpusTab(ctk.CTkFrame):
         if self.on_status_change:
             self.on_status_change("AI Processing...", "processing")
             
-        thread = threading.Thread(target=self._process_video)
-        thread.daemon = True
-        thread.start()
+        self._poll_id = self.after(50, self._drain_progress)
+        self._executor.submit(self._process_video, self._cancel)
         
-    def _process_video(self):
+    def _process_video(self, cancel: threading.Event):
         """Process video with AI"""
         try:
             # Simulate processing stages
-            stages = [
-                "Analyzing content...",
-                "Detecting highlights...",
-                "Generating clips...",
-                "Optimizing for platforms...",
-                "Exporting final clips..."
-            ]
+            stages = _STAGES
             
             for i, stage in enumerate(stages):
-                if not self.is_processing:
+                if cancel.is_set():
                     break
                     
                 progress = (i + 1) / len(stages)
-                self.after(0, lambda p=progress, s=stage, idx=i: self._update_progress(p, s, idx))
+                self._progress_q.put((progress, stage, i))
                 
-                # Simulate work
-                import time
-                time.sleep(2)
+                # Simulate work; returns early as soon as Stop is pressed
+                if cancel.wait(2):
+                    break
                 
-            if self.is_processing:
+            if not cancel.is_set():
                 self.after(0, self._on_complete)
                 
         except Exception as e:
-            self.after(0, lambda: self._on_error(str(e)))
+            if not cancel.is_set():
+                self.after(0, self._on_error, str(e))
             
+    def _drain_progress(self):
+        """Apply the latest queued progress and re-arm the poller (main thread)"""
+        latest = None
+        try:
+            while True:
+                latest = self._progress_q.get_nowait()
+        except queue.Empty:
+            pass
+        if latest is not None:
+            self._update_progress(*latest)
+        self._poll_id = self.after(50, self._drain_progress)
+        
+    def _stop_polling(self):
+        """Stop the progress poller and drop anything still queued"""
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        try:
+            while True:
+                self._progress_q.get_nowait()
+        except queue.Empty:
+            pass
+        
     def _update_progress(self, progress: float, status: str, stage_idx: int):
         """Update progress display"""
         self.progress_card.set_progress(progress, status)
         
-        # Mark previous stages complete
-        for i in range(stage_idx):
-            self.progress_card.set_stage(i, StageStatus.COMPLETED)
-        self.progress_card.set_stage(stage_idx, StageStatus.IN_PROGRESS)
+        # Mark newly finished stages complete (earlier ones already are)
+        if stage_idx != self._active_stage:
+            for i in range(max(self._active_stage, 0), stage_idx):
+                self.progress_card.set_stage(i, StageStatus.COMPLETED)
+            self.progress_card.set_stage(stage_idx, StageStatus.IN_PROGRESS)
+            self._active_stage = stage_idx
         
     def _on_complete(self):
         """Handle processing complete"""
         self.is_processing = False
+        self._stop_polling()
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.progress_card.complete(success=True)
@@ -453,12 +551,13 @@ class OpusTab(ctk.CTkFrame):
         if self.on_status_change:
             self.on_status_change("Ready", "success")
             
-        platforms = [p for p, s in self.selected_platforms.items() if s]
+        platforms = self._selected_platform_names()
         messagebox.showinfo("Complete", f"AI processing complete!\nOptimized for: {', '.join(platforms)}")
         
     def _on_error(self, error: str):
         """Handle error"""
         self.is_processing = False
+        self._stop_polling()
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.progress_card.complete(success=False)
@@ -468,9 +567,17 @@ class OpusTab(ctk.CTkFrame):
             
         messagebox.showerror("Error", f"Processing failed: {error}")
         
+    def destroy(self):
+        """Stop the running job and release the worker thread so the app can exit"""
+        self._cancel.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+        
     def _stop_processing(self):
         """Stop processing"""
+        self._cancel.set()
         self.is_processing = False
+        self._stop_polling()
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.progress_card.reset()
@@ -478,10 +585,14 @@ class OpusTab(ctk.CTkFrame):
         if self.on_status_change:
             self.on_status_change("Stopped", "warning")
             
+    def _selected_platform_names(self) -> List[str]:
+        """Names of the selected platforms, in display order"""
+        return list(compress(_PLATFORM_NAMES, self._platform_selected))
+        
     def get_settings(self) -> Dict[str, Any]:
         """Get current settings"""
         return {
-            'platforms': [p for p, s in self.selected_platforms.items() if s],
+            'platforms': self._selected_platform_names(),
             'ai_highlights': self.ai_highlights_var.get(),
             'add_captions': self.captions_var.get(),
             'enhancement_preset': self.enhance_var.get(),
@@ -491,9 +602,13 @@ class OpusTab(ctk.CTkFrame):
     def apply_settings(self, settings: Dict[str, Any]):
         """Apply settings"""
         if 'platforms' in settings:
-            for platform in self.selected_platforms:
-                selected = platform.lower().replace(' ', '_') in [p.lower().replace(' ', '_') for p in settings['platforms']]
-                self.selected_platforms[platform] = selected
+            wanted = {_platform_key(p) for p in settings['platforms']}
+            for i, (platform, key) in enumerate(zip(_PLATFORM_NAMES, _PLATFORM_KEYS)):
+                selected = key in wanted
+                # Flags mirror the cards, so an unchanged flag means nothing to redraw
+                if selected == self._platform_selected[i]:
+                    continue
+                self._platform_selected[i] = selected
                 if platform in self.platform_cards:
                     self.platform_cards[platform].set_selected(selected)
         if 'ai_highlights' in settings:
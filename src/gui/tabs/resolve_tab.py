@@ -4,27 +4,99 @@ Script management and Resolve integration
 """
 
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Callable, Optional, List, Dict
 from pathlib import Path
+import functools
 import shutil
+import subprocess
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from ..theme import theme, get_font
+from ..utils.mousewheel import bind_mousewheel
+
+
+@functools.cache
+def _resolve_comp_dir() -> Path:
+    """Resolve's Fusion Comp scripts folder (Workspace -> Scripts menu) for this OS"""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+        return base / "Blackmagic Design" / "DaVinci Resolve" / "Support" / "Fusion" / "Scripts" / "Comp"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "Blackmagic Design" / "DaVinci Resolve" / "Fusion" / "Scripts" / "Comp"
+    return Path.home() / ".local" / "share" / "DaVinciResolve" / "Fusion" / "Scripts" / "Comp"
+
+
+# Written by VideoSplitter whenever it generates an import script
+LATEST_IMPORT_POINTER = Path.home() / ".ltw_clipper" / "latest_import"
+
+# Bundled scripts as (name, description, icon)
+SCRIPTS = (
+    ("LTW_Universal_Import", "Import any folder of clips with timeline creation", "📥"),
+    ("LTW_Add_Transitions", "Add transitions between all clips", "🔀"),
+    ("LTW_Apply_Look", "Apply color grading presets and LUTs", "🎨"),
+    ("LTW_Project_Setup", "Quick project resolution and frame rate setup", "⚙️"),
+    ("LTW_Smart_Fit", "Auto-scale clips to match timeline resolution", "📐"),
+    ("LTW_Quick_Render", "One-click render with YouTube/social presets", "🎬"),
+    ("LTW_Add_Branding", "Add intros, outros, and branding elements", "🏷️"),
+    ("LTW_Import_Beat_Edits", "Create beat-synced timelines from audio", "🎵"),
+    ("LTW_Transcript_Importer", "Import SRT/JSON transcripts", "📝"),
+    ("LTW_Import_Smart_Clips", "Import AI-selected clips", "🤖"),
+    ("LTW_Use_Resolve_Transcription", "Use Resolve Studio's built-in transcription", "🎙️"),
+)
+SCRIPT_NAMES = frozenset(name for name, _, _ in SCRIPTS)
+
+# LUT gallery entries as (name, preview color)
+LUTS = (
+    ("Sports Pop", "#ff6b35"),
+    ("Cinematic Teal", "#00b4d8"),
+    ("Gaming Vibrant", "#9b5de5"),
+    ("Tutorial Clean", "#6b7280"),
+    ("Warm Sunset", "#f59e0b"),
+    ("Cool Night", "#1e40af"),
+)
+
+# LUT swatch geometry on the gallery canvas
+LUT_SWATCH_WIDTH = 96
+LUT_SWATCH_HEIGHT = 60
+LUT_LABEL_HEIGHT = 20
+
+
+def _copy_script(source: Path, dest: Path):
+    """Copy a script's bytes only (Resolve doesn't need mtime/permission metadata)"""
+    with open(source, 'rb') as src, open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst, 65536)
+
+
+def _open_in_file_manager(path: Path):
+    """Reveal a folder in Finder/Explorer/the desktop file manager without a shell"""
+    if sys.platform == "win32":
+        os.startfile(str(path))
+    else:
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        subprocess.Popen([opener, str(path)], close_fds=True)
 
 
 class ScriptCard(ctk.CTkFrame):
     """Card for a Resolve script"""
     
+    # Two 28px label rows plus padding; fixed so the card never asks its parents to re-layout
+    HEIGHT = 2 * 28 + 2 * theme.spacing.md + 2
+    
     def __init__(self, parent, name: str, description: str, icon: str,
                  installed: bool = False, on_install: Optional[Callable] = None, **kwargs):
         super().__init__(
             parent,
             fg_color=theme.colors.bg_tertiary,
             corner_radius=8,
+            height=self.HEIGHT,
             **kwargs
         )
+        self.grid_propagate(False)
         
         self.name = name
         self.installed = installed
@@ -34,61 +106,57 @@ class ScriptCard(ctk.CTkFrame):
         
     def _create_widgets(self, description: str, icon: str):
         """Create card widgets"""
-        content = ctk.CTkFrame(self, fg_color="transparent")
-        content.pack(fill="x", padx=theme.spacing.md, pady=theme.spacing.md)
-        
-        # Icon and info
-        info_frame = ctk.CTkFrame(content, fg_color="transparent")
-        info_frame.pack(side="left", fill="x", expand=True)
+        md = theme.spacing.md
         
-        title_row = ctk.CTkFrame(info_frame, fg_color="transparent")
-        title_row.pack(anchor="w")
+        # Title row (icon, name, status) over the description, button on the right;
+        # gridded straight into the card instead of nested wrapper frames
+        self.grid_columnconfigure(2, weight=1)
         
         icon_label = ctk.CTkLabel(
-            title_row,
+            self,
             text=icon,
             font=get_font("lg")
         )
-        icon_label.pack(side="left", padx=(0, theme.spacing.sm))
+        icon_label.grid(row=0, column=0, padx=(md, theme.spacing.sm), pady=(md, 0), sticky="w")
         
         name_label = ctk.CTkLabel(
-            title_row,
+            self,
             text=self.name,
             font=get_font("sm", "bold"),
             text_color=theme.colors.text_primary
         )
-        name_label.pack(side="left")
+        name_label.grid(row=0, column=1, pady=(md, 0), sticky="w")
         
         if self.installed:
             status_label = ctk.CTkLabel(
-                title_row,
+                self,
                 text="✓ Installed",
                 font=get_font("xs"),
                 text_color=theme.colors.success
             )
-            status_label.pack(side="left", padx=(theme.spacing.sm, 0))
+            status_label.grid(row=0, column=2, padx=(theme.spacing.sm, 0), pady=(md, 0), sticky="w")
         
         desc_label = ctk.CTkLabel(
-            info_frame,
+            self,
             text=description,
             font=get_font("xs"),
             text_color=theme.colors.text_muted,
             anchor="w"
         )
-        desc_label.pack(anchor="w", pady=(2, 0))
+        desc_label.grid(row=1, column=0, columnspan=3, padx=(md, 0), pady=(2, md), sticky="w")
         
         # Install button
         if not self.installed:
             install_btn = ctk.CTkButton(
-                content,
+                self,
                 text="Install",
                 font=get_font("xs"),
                 width=60,
                 height=28,
-                command=lambda: self._on_install_click(),
+                command=self._on_install_click,
                 **theme.get_button_style("secondary")
             )
-            install_btn.pack(side="right")
+            install_btn.grid(row=0, column=3, rowspan=2, padx=(0, md), pady=md)
             
     def _on_install_click(self):
         """Handle install click"""
@@ -96,39 +164,6 @@ class ScriptCard(ctk.CTkFrame):
             self.on_install(self.name)
 
 
-class LUTCard(ctk.CTkFrame):
-    """Card for a LUT preview"""
-    
-    def __init__(self, parent, name: str, preview_color: str, **kwargs):
-        super().__init__(
-            parent,
-            fg_color=theme.colors.bg_tertiary,
-            corner_radius=8,
-            cursor="hand2",
-            **kwargs
-        )
-        
-        self.name = name
-        
-        # Color preview
-        preview = ctk.CTkFrame(
-            self,
-            fg_color=preview_color,
-            height=60,
-            corner_radius=8
-        )
-        preview.pack(fill="x", padx=4, pady=4)
-        
-        # Name
-        name_label = ctk.CTkLabel(
-            self,
-            text=name,
-            font=get_font("xs"),
-            text_color=theme.colors.text_secondary
-        )
-        name_label.pack(pady=(0, 4))
-
-
 class ResolveTab(ctk.CTkFrame):
     """DaVinci Resolve integration tab"""
     
@@ -142,27 +177,90 @@ class ResolveTab(ctk.CTkFrame):
         self.on_status_change = on_status_change
         self.scripts_dir = Path(__file__).parent.parent.parent / "resolve_scripts"
         self.luts_dir = Path(__file__).parent.parent.parent / "assets" / "luts"
+        self._installed_scripts = self._scan_installed_scripts()
+        self._script_count: Optional[int] = None
+        self._ensured_dirs = set()
+        self._installing = False
         
         self._create_widgets()
         
     def _create_widgets(self):
         """Create tab widgets"""
-        # Scrollable container
-        self.scroll_frame = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent"
+        # Scrollable container: a plain canvas hosting one inner frame
+        # (avoids CTkScrollableFrame's extra canvas layer and resize lag)
+        container = ctk.CTkFrame(self, fg_color="transparent")
+        self.scroll_canvas = tk.Canvas(
+            container,
+            bg=theme.colors.bg_dark,
+            highlightthickness=0,
+            bd=0
         )
-        self.scroll_frame.pack(fill="both", expand=True, padx=theme.spacing.lg, pady=theme.spacing.lg)
+        self.scroll_bar = ctk.CTkScrollbar(container, command=self.scroll_canvas.yview)
+        self.scroll_frame = ctk.CTkFrame(self.scroll_canvas, fg_color="transparent")
+        self._scroll_window = self.scroll_canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
+        
+        self.scroll_frame.bind("<Configure>", self._on_content_resize)
+        self.scroll_canvas.bind("<Configure>", self._on_canvas_resize)
+        self.scroll_bar.pack(side="right", fill="y")
+        self.scroll_canvas.pack(side="left", fill="both", expand=True)
+        
+        # Sections are built while the container is unmapped and shown once,
+        # so the scroll region is laid out in one pass instead of per child
+        self._build_header()
+        self._build_actions()
+        self._build_scripts()
+        bind_mousewheel(self.scroll_canvas, self._on_wheel)
+        self._wheel_sections = set(self.scroll_frame.winfo_children())
+        container.pack(fill="both", expand=True, padx=theme.spacing.lg, pady=theme.spacing.lg)
+        
+        # LUT gallery and help are built the first time the view nears them
+        self._deferred = [self._build_luts, self._build_help]
+        self._deferred_id = None
+        self.scroll_canvas.configure(yscrollcommand=self._on_yscroll)
+        
+    def _on_content_resize(self, event):
+        """Grow the scroll region with the inner frame"""
+        self.scroll_canvas.configure(scrollregion=self.scroll_canvas.bbox("all"))
+        
+    def _on_canvas_resize(self, event):
+        """Keep the inner frame as wide as the visible canvas"""
+        self.scroll_canvas.itemconfigure(self._scroll_window, width=event.width)
+        
+    def _on_wheel(self, step: int):
+        """Scroll with the mouse wheel while the pointer is over the tab"""
+        self.scroll_canvas.yview_scroll(step, "units")
+        
+    def _on_yscroll(self, first, last):
+        """Forward scroll position to the scrollbar and reveal deferred sections"""
+        self.scroll_bar.set(first, last)
+        if float(last) >= 0.9 and self._deferred_id is None:
+            self._deferred_id = self.after_idle(self._build_next_section)
+            
+    def _build_next_section(self):
+        """Build the next deferred section; stop watching once all are built"""
+        self._deferred_id = None
+        if self._deferred:
+            self._deferred.pop(0)()
+            for section in self.scroll_frame.winfo_children():
+                if section not in self._wheel_sections:
+                    bind_mousewheel(section, self._on_wheel)
+                    self._wheel_sections.add(section)
+        if not self._deferred:
+            self.scroll_canvas.configure(yscrollcommand=self.scroll_bar.set)
+            
+    def _build_header(self):
+        """Build the tab header"""
+        c = theme.colors
+        sp = theme.spacing
         
-        # Header
         header = ctk.CTkFrame(self.scroll_frame, fg_color="transparent")
-        header.pack(fill="x", pady=(0, theme.spacing.xl))
+        header.pack(fill="x", pady=(0, sp.xl))
         
         title = ctk.CTkLabel(
             header,
             text="🎭  DaVinci Resolve",
             font=get_font("2xl", "bold"),
-            text_color=theme.colors.text_primary
+            text_color=c.text_primary
         )
         title.pack(anchor="w")
         
@@ -170,28 +268,32 @@ class ResolveTab(ctk.CTkFrame):
             header,
             text="Automation scripts and integration tools for DaVinci Resolve",
             font=get_font("md"),
-            text_color=theme.colors.text_secondary
+            text_color=c.text_secondary
         )
-        subtitle.pack(anchor="w", pady=(theme.spacing.xs, 0))
+        subtitle.pack(anchor="w", pady=(sp.xs, 0))
+        
+    def _build_actions(self):
+        """Build the quick actions card"""
+        c = theme.colors
+        sp = theme.spacing
         
-        # Quick Actions
         actions_card = ctk.CTkFrame(
             self.scroll_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=theme.spacing.card_radius
+            fg_color=c.bg_secondary,
+            corner_radius=sp.card_radius
         )
-        actions_card.pack(fill="x", pady=(0, theme.spacing.lg))
+        actions_card.pack(fill="x", pady=(0, sp.lg))
         
         actions_title = ctk.CTkLabel(
             actions_card,
             text="⚡  Quick Actions",
             font=get_font("md", "bold"),
-            text_color=theme.colors.text_primary
+            text_color=c.text_primary
         )
-        actions_title.pack(anchor="w", padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.md))
+        actions_title.pack(anchor="w", padx=sp.lg, pady=(sp.lg, sp.md))
         
         actions_grid = ctk.CTkFrame(actions_card, fg_color="transparent")
-        actions_grid.pack(fill="x", padx=theme.spacing.lg, pady=(0, theme.spacing.lg))
+        actions_grid.pack(fill="x", padx=sp.lg, pady=(0, sp.lg))
         
         # Install all button
         install_all_btn = ctk.CTkButton(
@@ -202,7 +304,7 @@ class ResolveTab(ctk.CTkFrame):
             command=self._install_all_scripts,
             **theme.get_button_style("primary")
         )
-        install_all_btn.pack(fill="x", pady=(0, theme.spacing.sm))
+        install_all_btn.pack(fill="x", pady=(0, sp.sm))
         
         # Quick action buttons row
         quick_row = ctk.CTkFrame(actions_grid, fg_color="transparent")
@@ -223,24 +325,28 @@ class ResolveTab(ctk.CTkFrame):
                 command=command,
                 **theme.get_button_style("secondary")
             )
-            btn.pack(side="left", fill="x", expand=True, padx=(0, theme.spacing.xs))
+            btn.pack(side="left", fill="x", expand=True, padx=(0, sp.xs))
             
-        # Scripts Section
+    def _build_scripts(self):
+        """Build the available scripts card"""
+        c = theme.colors
+        sp = theme.spacing
+        
         scripts_card = ctk.CTkFrame(
             self.scroll_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=theme.spacing.card_radius
+            fg_color=c.bg_secondary,
+            corner_radius=sp.card_radius
         )
-        scripts_card.pack(fill="x", pady=(0, theme.spacing.lg))
+        scripts_card.pack(fill="x", pady=(0, sp.lg))
         
         scripts_header = ctk.CTkFrame(scripts_card, fg_color="transparent")
-        scripts_header.pack(fill="x", padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.md))
+        scripts_header.pack(fill="x", padx=sp.lg, pady=(sp.lg, sp.md))
         
         scripts_title = ctk.CTkLabel(
             scripts_header,
             text="📜  Available Scripts",
             font=get_font("md", "bold"),
-            text_color=theme.colors.text_primary
+            text_color=c.text_primary
         )
         scripts_title.pack(side="left")
         
@@ -249,29 +355,15 @@ class ResolveTab(ctk.CTkFrame):
             scripts_header,
             text=f"{script_count} scripts",
             font=get_font("xs"),
-            text_color=theme.colors.text_muted
+            text_color=c.text_muted
         )
         count_label.pack(side="right")
         
         # Script list
         scripts_list = ctk.CTkFrame(scripts_card, fg_color="transparent")
-        scripts_list.pack(fill="x", padx=theme.spacing.lg, pady=(0, theme.spacing.lg))
-        
-        scripts = [
-            ("LTW_Universal_Import", "Import any folder of clips with timeline creation", "📥"),
-            ("LTW_Add_Transitions", "Add transitions between all clips", "🔀"),
-            ("LTW_Apply_Look", "Apply color grading presets and LUTs", "🎨"),
-            ("LTW_Project_Setup", "Quick project resolution and frame rate setup", "⚙️"),
-            ("LTW_Smart_Fit", "Auto-scale clips to match timeline resolution", "📐"),
-            ("LTW_Quick_Render", "One-click render with YouTube/social presets", "🎬"),
-            ("LTW_Add_Branding", "Add intros, outros, and branding elements", "🏷️"),
-            ("LTW_Import_Beat_Edits", "Create beat-synced timelines from audio", "🎵"),
-            ("LTW_Transcript_Importer", "Import SRT/JSON transcripts", "📝"),
-            ("LTW_Import_Smart_Clips", "Import AI-selected clips", "🤖"),
-            ("LTW_Use_Resolve_Transcription", "Use Resolve Studio's built-in transcription", "🎙️"),
-        ]
+        scripts_list.pack(fill="x", padx=sp.lg, pady=(0, sp.lg))
         
-        for name, desc, icon in scripts:
+        for name, desc, icon in SCRIPTS:
             installed = self._is_script_installed(name)
             card = ScriptCard(
                 scripts_list,
@@ -283,45 +375,61 @@ class ResolveTab(ctk.CTkFrame):
             )
             card.pack(fill="x", pady=2)
             
-        # LUTs Section
+    def _build_luts(self):
+        """Build the LUT gallery card"""
+        c = theme.colors
+        sp = theme.spacing
+        
         luts_card = ctk.CTkFrame(
             self.scroll_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=theme.spacing.card_radius
+            fg_color=c.bg_secondary,
+            corner_radius=sp.card_radius
         )
-        luts_card.pack(fill="x", pady=(0, theme.spacing.lg))
+        luts_card.pack(fill="x", pady=(0, sp.lg))
         
         luts_title = ctk.CTkLabel(
             luts_card,
             text="🎨  LUT Gallery",
             font=get_font("md", "bold"),
-            text_color=theme.colors.text_primary
+            text_color=c.text_primary
         )
-        luts_title.pack(anchor="w", padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.md))
+        luts_title.pack(anchor="w", padx=sp.lg, pady=(sp.lg, sp.md))
         
         luts_desc = ctk.CTkLabel(
             luts_card,
             text="Available color grading LUTs",
             font=get_font("sm"),
-            text_color=theme.colors.text_secondary
+            text_color=c.text_secondary
         )
-        luts_desc.pack(anchor="w", padx=theme.spacing.lg)
-        
-        luts_grid = ctk.CTkFrame(luts_card, fg_color="transparent")
-        luts_grid.pack(fill="x", padx=theme.spacing.lg, pady=theme.spacing.lg)
-        
-        luts = [
-            ("Sports Pop", "#ff6b35"),
-            ("Cinematic Teal", "#00b4d8"),
-            ("Gaming Vibrant", "#9b5de5"),
-            ("Tutorial Clean", "#6b7280"),
-            ("Warm Sunset", "#f59e0b"),
-            ("Cool Night", "#1e40af")
-        ]
+        luts_desc.pack(anchor="w", padx=sp.lg)
         
-        for name, color in luts:
-            card = LUTCard(luts_grid, name=name, preview_color=color)
-            card.pack(side="left", padx=(0, theme.spacing.sm))
+        # All swatches are drawn on one canvas rather than a card frame per LUT
+        step = LUT_SWATCH_WIDTH + sp.sm
+        gallery = tk.Canvas(
+            luts_card,
+            width=step * len(LUTS),
+            height=LUT_SWATCH_HEIGHT + LUT_LABEL_HEIGHT + 8,
+            bg=c.bg_secondary,
+            highlightthickness=0,
+            bd=0
+        )
+        gallery.pack(anchor="w", padx=sp.lg, pady=sp.lg)
+        
+        font = get_font("xs")
+        for i, (name, color) in enumerate(LUTS):
+            x = i * step
+            gallery.create_rectangle(
+                x, 0, x + LUT_SWATCH_WIDTH, LUT_SWATCH_HEIGHT + LUT_LABEL_HEIGHT + 8,
+                fill=c.bg_tertiary, outline=""
+            )
+            gallery.create_rectangle(
+                x + 4, 4, x + LUT_SWATCH_WIDTH - 4, LUT_SWATCH_HEIGHT + 4,
+                fill=color, outline=""
+            )
+            gallery.create_text(
+                x + LUT_SWATCH_WIDTH // 2, LUT_SWATCH_HEIGHT + 4 + LUT_LABEL_HEIGHT // 2,
+                text=name, font=font, fill=c.text_secondary
+            )
             
         # Add LUT button
         add_lut_btn = ctk.CTkButton(
@@ -332,13 +440,17 @@ class ResolveTab(ctk.CTkFrame):
             command=self._add_custom_lut,
             **theme.get_button_style("ghost")
         )
-        add_lut_btn.pack(anchor="w", padx=theme.spacing.lg, pady=(0, theme.spacing.lg))
+        add_lut_btn.pack(anchor="w", padx=sp.lg, pady=(0, sp.lg))
+        
+    def _build_help(self):
+        """Build the usage instructions card"""
+        c = theme.colors
+        sp = theme.spacing
         
-        # Instructions
         help_card = ctk.CTkFrame(
             self.scroll_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=theme.spacing.card_radius
+            fg_color=c.bg_secondary,
+            corner_radius=sp.card_radius
         )
         help_card.pack(fill="x")
         
@@ -346,37 +458,54 @@ class ResolveTab(ctk.CTkFrame):
             help_card,
             text="📖  How to Use",
             font=get_font("md", "bold"),
-            text_color=theme.colors.text_primary
+            text_color=c.text_primary
         )
-        help_title.pack(anchor="w", padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.md))
+        help_title.pack(anchor="w", padx=sp.lg, pady=(sp.lg, sp.md))
         
-        instructions = """1. Click "Install All Scripts" to copy scripts to Resolve's script folder
+        instructions = f"""1. Click "Install All Scripts" to copy scripts to Resolve's script folder
 2. Open DaVinci Resolve
 3. Go to Workspace → Scripts → select any LTW script
 4. Follow the on-screen prompts
 
 Scripts are installed to:
-~/Library/Application Support/Blackmagic Design/DaVinci Resolve/Fusion/Scripts/Comp/"""
+{_resolve_comp_dir()}"""
         
         help_text = ctk.CTkLabel(
             help_card,
             text=instructions,
             font=get_font("sm"),
-            text_color=theme.colors.text_secondary,
+            text_color=c.text_secondary,
             justify="left"
         )
-        help_text.pack(anchor="w", padx=theme.spacing.lg, pady=(0, theme.spacing.lg))
+        help_text.pack(anchor="w", padx=sp.lg, pady=(0, sp.lg))
         
     def _get_script_count(self) -> int:
-        """Get number of available scripts"""
-        if self.scripts_dir.exists():
-            return len(list(self.scripts_dir.glob("*.lua")))
-        return 0
-        
+        """Get number of available scripts (counted once; installs don't change the source folder)"""
+        if self._script_count is None:
+            try:
+                with os.scandir(self.scripts_dir) as entries:
+                    self._script_count = sum(1 for e in entries if e.name.endswith(".lua"))
+            except OSError:
+                self._script_count = 0
+        return self._script_count
+        
+    def _scan_installed_scripts(self) -> frozenset:
+        """Names of .lua scripts already in Resolve's Comp folder (one directory scan)"""
+        try:
+            with os.scandir(_resolve_comp_dir()) as entries:
+                return frozenset(e.name[:-4] for e in entries if e.name.endswith(".lua")) & SCRIPT_NAMES
+        except OSError:
+            return frozenset()
+            
+    def _ensure_dir(self, path: Path):
+        """Create a directory the first time it is needed in this session"""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+            
     def _is_script_installed(self, name: str) -> bool:
         """Check if a script is installed in Resolve"""
-        resolve_scripts_dir = Path.home() / "Library" / "Application Support" / "Blackmagic Design" / "DaVinci Resolve" / "Fusion" / "Scripts" / "Comp"
-        return (resolve_scripts_dir / f"{name}.lua").exists()
+        return name in self._installed_scripts
         
     def _install_script(self, name: str):
         """Install a single script"""
@@ -385,11 +514,12 @@ Scripts are installed to:
             messagebox.showerror("Error", f"Script not found: {name}")
             return
             
-        dest_dir = Path.home() / "Library" / "Application Support" / "Blackmagic Design" / "DaVinci Resolve" / "Fusion" / "Scripts" / "Comp"
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        dest_dir = _resolve_comp_dir()
+        self._ensure_dir(dest_dir)
         
         try:
             shutil.copy2(source, dest_dir / f"{name}.lua")
+            self._installed_scripts |= {name}
             messagebox.showinfo("Success", f"Installed {name} to Resolve!")
             
             if self.on_status_change:
@@ -398,52 +528,104 @@ Scripts are installed to:
             messagebox.showerror("Error", f"Failed to install: {e}")
             
     def _install_all_scripts(self):
-        """Install all scripts to Resolve"""
+        """Install all scripts to Resolve (copies run off the Tk thread)"""
+        if self._installing:
+            return
         if not self.scripts_dir.exists():
             messagebox.showerror("Error", "Scripts directory not found")
             return
             
-        dest_dir = Path.home() / "Library" / "Application Support" / "Blackmagic Design" / "DaVinci Resolve" / "Fusion" / "Scripts" / "Comp"
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        # Created here so _ensured_dirs is only touched on the Tk thread
+        dest_dir = _resolve_comp_dir()
+        try:
+            self._ensure_dir(dest_dir)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to install: {e}")
+            return
+            
+        self._installing = True
+        if self.on_status_change:
+            self.on_status_change("Installing scripts...", "processing")
+        threading.Thread(target=self._do_install_all, args=(dest_dir,), daemon=True).start()
         
-        installed = 0
-        for script in self.scripts_dir.glob("*.lua"):
+    def _do_install_all(self, dest_dir: Path):
+        """Copy every bundled script into Resolve's folder (worker thread)"""
+        try:
+            scripts = [p for p in self.scripts_dir.iterdir() if p.suffix == ".lua"]
+        except Exception as e:
+            self.after(0, self._on_install_all_failed, str(e))
+            return
+        
+        def install(script: Path) -> bool:
             try:
-                shutil.copy2(script, dest_dir / script.name)
-                installed += 1
+                _copy_script(script, dest_dir / script.name)
+                return True
             except Exception as e:
                 print(f"Failed to install {script.name}: {e}")
+                return False
                 
+        # Small files: the copies are syscall-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(install, scripts))
+            
+        names = [script.stem for script, ok in zip(scripts, results) if ok]
+        self.after(0, self._on_install_all_complete, names)
+        
+    def _on_install_all_complete(self, names: List[str]):
+        """Report a finished bulk install (main thread)"""
+        self._installing = False
+        self._installed_scripts |= set(names)
+        installed = len(names)
+        
         messagebox.showinfo("Complete", f"Installed {installed} scripts to DaVinci Resolve!")
         
         if self.on_status_change:
             self.on_status_change(f"Installed {installed} scripts", "success")
             
+    def _on_install_all_failed(self, error: str):
+        """Report a bulk install that could not start (main thread)"""
+        self._installing = False
+        messagebox.showerror("Error", f"Failed to install scripts: {error}")
+        
+        if self.on_status_change:
+            self.on_status_change("Script install failed", "error")
+            
     def _open_scripts_folder(self):
         """Open scripts folder in Finder"""
         if self.scripts_dir.exists():
-            os.system(f'open "{self.scripts_dir}"')
+            _open_in_file_manager(self.scripts_dir)
         else:
             messagebox.showerror("Error", "Scripts folder not found")
             
     def _open_luts_folder(self):
         """Open LUTs folder in Finder"""
-        self.luts_dir.mkdir(parents=True, exist_ok=True)
-        os.system(f'open "{self.luts_dir}"')
+        self._ensure_dir(self.luts_dir)
+        _open_in_file_manager(self.luts_dir)
         
     def _copy_import_script(self):
         """Copy import script path to clipboard"""
-        # Find the most recent import script
-        resolve_dir = Path.home() / "Desktop" / "clips" / "resolve_project"
-        if resolve_dir.exists():
-            scripts = list(resolve_dir.glob("*_import.lua"))
-            if scripts:
-                latest = max(scripts, key=lambda p: p.stat().st_mtime)
-                self.clipboard_clear()
-                self.clipboard_append(str(latest))
-                messagebox.showinfo("Copied", f"Import script path copied to clipboard:\n{latest}")
-                return
-                
+        # Find the most recent import script: recorded pointer first, folder scan as fallback
+        latest = None
+        try:
+            recorded = Path(LATEST_IMPORT_POINTER.read_text(encoding='utf-8').strip())
+            if recorded.is_file():
+                latest = recorded
+        except OSError:
+            pass
+            
+        if latest is None:
+            resolve_dir = Path.home() / "Desktop" / "clips" / "resolve_project"
+            if resolve_dir.exists():
+                scripts = list(resolve_dir.glob("*_import.lua"))
+                if scripts:
+                    latest = max(scripts, key=lambda p: p.stat().st_mtime)
+                    
+        if latest is not None:
+            self.clipboard_clear()
+            self.clipboard_append(str(latest))
+            messagebox.showinfo("Copied", f"Import script path copied to clipboard:\n{latest}")
+            return
+            
         messagebox.showwarning("Not Found", "No import scripts found. Process some videos first!")
         
     def _add_custom_lut(self):
@@ -452,7 +634,7 @@ Scripts are installed to:
         file = filedialog.askopenfilename(title="Select LUT File", filetypes=filetypes)
         
         if file:
-            self.luts_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.luts_dir)
             dest = self.luts_dir / Path(file).name
             
             try:
@@ -10,6 +10,8 @@ from pathlib import Path
 import threading
 import sys
 import os
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 
 from ..theme import theme, get_font
 from ..components.file_picker import FilePicker
@@ -60,6 +62,20 @@ class SplitTab(ctk.CTkFrame):
         self.is_processing = False
         self.selected_files: List[Path] = []
         
+        # VideoSplitter instances reused across previews, keyed by their settings
+        # (Tk thread only; each processing run gets its own)
+        self._splitter_cache: Dict[tuple, Any] = {}
+        self._VideoSplitter = None  # Imported on first use to keep startup fast
+        
+        # Set by Stop; the splitter terminates its running ffmpeg when it sees it.
+        # Replaced for every run so a stopped worker that hasn't noticed yet stays stopped
+        self._cancel = threading.Event()
+        
+        # Latest progress from the worker, flushed to the UI at most every 50 ms
+        self._progress_lock = threading.Lock()
+        self._pending_progress: Optional[tuple] = None
+        self._progress_scheduled = False
+        
         self._create_widgets()
         
     def _create_widgets(self):
@@ -466,20 +482,115 @@ class SplitTab(ctk.CTkFrame):
             messagebox.showwarning("No Files", "Please select video files first")
             return
             
-        duration = int(self.duration_slider.get())
-        quality = self.quality_var.get()
+        settings = {
+            'duration': int(self.duration_slider.get()),
+            'quality': self.quality_var.get(),
+            'scene_detection': self.scene_detect_var.get(),
+            'output_dir': self.output_var.get()
+        }
+        
+        # Resolved on the Tk thread so the splitter cache is never shared with the worker
+        try:
+            splitter = self._get_splitter(
+                output_dir=settings['output_dir'],
+                clip_duration=settings['duration'],
+                quality=settings['quality'],
+                resolve_integration=False,
+                scene_detection=settings['scene_detection']
+            )
+        except Exception as e:
+            messagebox.showerror("Preview", f"Preview failed: {e}")
+            return
+        
+        # Progress window; becomes the results window once probing finishes
+        self.preview_btn.configure(state="disabled")
+        window = ctk.CTkToplevel(self)
+        window.title("Preview")
+        window.geometry("480x360")
+        window.configure(fg_color=theme.colors.bg_primary)
+        window.transient(self.winfo_toplevel())
+        
+        status = ctk.CTkLabel(
+            window,
+            text=f"Analyzing {len(self.selected_files)} video(s)…",
+            font=get_font("md"),
+            text_color=theme.colors.text_primary
+        )
+        status.pack(padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.sm))
+        
+        bar = ctk.CTkProgressBar(
+            window,
+            mode="indeterminate",
+            fg_color=theme.colors.bg_tertiary,
+            progress_color=theme.colors.accent_primary,
+            height=8
+        )
+        bar.pack(fill="x", padx=theme.spacing.lg)
+        bar.start()
+        
+        files = list(self.selected_files)
+        
+        def worker():
+            try:
+                result = self._compute_preview(splitter, files, settings)
+            except Exception as e:
+                result = f"Preview failed: {e}"
+            self.after(0, self._show_preview_result, window, result)
+            
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+        
+    def _compute_preview(self, splitter, files: List[Path], settings: Dict[str, Any]) -> str:
+        """Estimate clip counts and build the preview text (no Tk calls)"""
+        # Probing opens each file, so run the probes concurrently
+        clip_counts: Dict[Path, int] = {}
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2, len(files))) as executor:
+            futures = {executor.submit(splitter.estimate_clips, file): file for file in files}
+            for future in as_completed(futures):
+                clip_counts[futures[future]] = future.result()
+        total_clips = sum(clip_counts.values())
         
         preview_text = f"Settings:\n"
-        preview_text += f"• Duration: {duration} seconds\n"
-        preview_text += f"• Quality: {quality}\n"
-        preview_text += f"• Scene Detection: {'Yes' if self.scene_detect_var.get() else 'No'}\n"
-        preview_text += f"• Output: {self.output_var.get()}\n\n"
-        preview_text += f"Files to process:\n"
+        preview_text += f"• Duration: {settings['duration']} seconds\n"
+        preview_text += f"• Quality: {settings['quality']}\n"
+        preview_text += f"• Scene Detection: {'Yes' if settings['scene_detection'] else 'No'}\n"
+        preview_text += f"• Output: {settings['output_dir']}\n\n"
+        preview_text += f"Files to process ({total_clips} clips):\n"
+        
+        for file in files:
+            preview_text += f"• {file.name} — {clip_counts[file]} clips\n"
+            
+        return preview_text
         
-        for file in self.selected_files:
-            preview_text += f"• {file.name}\n"
+    def _show_preview_result(self, window, preview_text: str):
+        """Replace the progress view with the preview text (called from main thread)"""
+        self.preview_btn.configure(state="normal")
+        if not window.winfo_exists():
+            return
             
-        messagebox.showinfo("Preview", preview_text)
+        for child in window.winfo_children():
+            child.destroy()
+            
+        textbox = ctk.CTkTextbox(
+            window,
+            font=get_font("sm"),
+            fg_color=theme.colors.bg_secondary,
+            text_color=theme.colors.text_primary,
+            wrap="word"
+        )
+        textbox.pack(fill="both", expand=True, padx=theme.spacing.lg, pady=(theme.spacing.lg, theme.spacing.sm))
+        textbox.insert("1.0", preview_text)
+        textbox.configure(state="disabled")
+        
+        ctk.CTkButton(
+            window,
+            text="Close",
+            font=get_font("sm"),
+            height=32,
+            command=window.destroy,
+            **theme.get_button_style("secondary")
+        ).pack(pady=(0, theme.spacing.lg))
         
     def _start_processing(self):
         """Start video processing"""
@@ -491,6 +602,8 @@ class SplitTab(ctk.CTkFrame):
             return
             
         self.is_processing = True
+        self._cancel = threading.Event()
+        self.file_picker.set_enabled(False)
         self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
         self.progress_card.start_processing()
@@ -499,50 +612,148 @@ class SplitTab(ctk.CTkFrame):
             self.on_status_change("Processing...", "processing")
             
         # Start processing in background
-        thread = threading.Thread(target=self._process_videos)
+        thread = threading.Thread(target=self._process_videos, args=(self._cancel,))
         thread.daemon = True
         thread.start()
         
-    def _process_videos(self):
+    def _process_videos(self, cancel: threading.Event):
         """Process videos in background thread"""
         try:
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-            from src.core.video_splitter import VideoSplitter
-            
-            splitter = VideoSplitter(
-                output_dir=self.output_var.get(),
-                clip_duration=int(self.duration_slider.get()),
-                quality=self.quality_var.get(),
-                resolve_integration=self.resolve_var.get(),
-                project_name=self.project_var.get() or None,
-                scene_detection=self.scene_detect_var.get(),
-                naming_pattern=self.naming_var.get()
-            )
+            settings = {
+                'output_dir': self.output_var.get(),
+                'clip_duration': int(self.duration_slider.get()),
+                'quality': self.quality_var.get(),
+                'resolve_integration': self.resolve_var.get(),
+                'project_name': self.project_var.get() or None,
+                'scene_detection': self.scene_detect_var.get(),
+                'naming_pattern': self.naming_var.get()
+            }
+            # A fresh splitter per run, so a blank project field gets a new project name
+            # and no run shares metadata or callbacks with another
+            splitter = self._load_splitter_class()(**settings, cancel_event=cancel)
             
+            # Snapshot the selection so edits during processing don't shift the loop
+            files = list(self.selected_files)
+            total_files = len(files)
             total_clips = 0
-            total_files = len(self.selected_files)
             
-            for i, video_file in enumerate(self.selected_files):
-                if not self.is_processing:
-                    break
+            # ffmpeg is CPU and disk heavy; half the cores keeps the drive from thrashing
+            workers = min(total_files, max(1, (os.cpu_count() or 2) // 2))
+            
+            if workers == 1:
+                for i, video_file in enumerate(files):
+                    if cancel.is_set():
+                        break
+                        
+                    # Update progress
+                    progress = (i / total_files) * 0.9
+                    self._post_progress(progress, f"Processing {video_file.name}")
+                    splitter.progress_cb = lambda done, total, i=i, name=video_file.name: self._post_progress(
+                        ((i + done / total) / total_files) * 0.9, f"Processing {name} ({done}/{total} clips)"
+                    )
                     
-                # Update progress
-                progress = (i / total_files) * 0.9
-                self.after(0, lambda p=progress, f=video_file.name: self._update_ui_progress(p, f"Processing {f}"))
-                
-                try:
-                    clips = splitter.split_video(video_file)
-                    total_clips += clips
-                except Exception as e:
-                    print(f"Error processing {video_file.name}: {e}")
+                    try:
+                        clips = splitter.split_video(video_file)
+                        total_clips += clips
+                    except Exception as e:
+                        print(f"Error processing {video_file.name}: {e}")
+            else:
+                total_clips = self._process_parallel(splitter, settings, files, workers, cancel)
                     
-            # Complete
-            self.after(0, lambda: self._on_complete(total_clips))
+            # Complete (Stop already reset the UI)
+            if not cancel.is_set():
+                self.after(0, lambda: self._on_complete(total_clips))
             
         except Exception as e:
-            self.after(0, lambda: self._on_error(str(e)))
+            if not cancel.is_set():
+                self.after(0, self._on_error, str(e))
+            
+    def _process_parallel(self, splitter, settings: Dict[str, Any], files: List[Path], workers: int,
+                          cancel: threading.Event) -> int:
+        """Split files in worker processes and write one merged metadata/Resolve project"""
+        # Already importable: _load_splitter_class loaded the module
+        from src.core.video_splitter import _split_video_worker
+        
+        total_files = len(files)
+        total_clips = 0
+        finished = 0
+        results: Dict[Path, list] = {}
+        
+        self._post_progress(0, f"Processing {total_files} videos with {workers} workers")
+        with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=workers) as executor:
+            # Workers share the parent's project name so every clip lands in one project,
+            # and a manager Event so Stop reaches ffmpeg in every worker
+            worker_cancel = manager.Event()
+            worker_settings = dict(settings, project_name=splitter.project_name, cancel_event=worker_cancel)
+            
+            futures = {executor.submit(_split_video_worker, video_file, worker_settings): video_file for video_file in files}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    video_file = futures[future]
+                    try:
+                        clips, metadata = future.result()
+                        total_clips += clips
+                        results[video_file] = metadata
+                    except Exception as e:
+                        print(f"Error processing {video_file.name}: {e}")
+                        
+                    finished += 1
+                    self._post_progress((finished / total_files) * 0.9, f"Finished {video_file.name}")
+                    
+                if cancel.is_set() and not worker_cancel.is_set():
+                    worker_cancel.set()
+                    for future in pending:
+                        future.cancel()
+                        
+        # Merge in selection order, then write the project files once
+        for video_file in files:
+            splitter.clip_metadata.extend(results.get(video_file, []))
+        if splitter.clip_metadata:
+            source_video = files[-1].name
+            splitter._save_metadata(source_video)
+            if splitter.resolve_integration:
+                splitter._generate_resolve_project(source_video)
+                
+        return total_clips
+        
+    def _load_splitter_class(self):
+        """Import VideoSplitter on first use"""
+        if self._VideoSplitter is None:
+            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+            from src.core.video_splitter import VideoSplitter
+            self._VideoSplitter = VideoSplitter
+        return self._VideoSplitter
+        
+    def _get_splitter(self, **settings):
+        """Return a cached VideoSplitter for previewing these settings, creating it on first use"""
+        key = tuple(sorted(settings.items()))
+        splitter = self._splitter_cache.get(key)
+        if splitter is None:
+            splitter = self._load_splitter_class()(**settings)
+            self._splitter_cache[key] = splitter
+        return splitter
+        
+    def _post_progress(self, progress: float, status: str):
+        """Record progress from the worker thread and schedule a single UI flush"""
+        with self._progress_lock:
+            self._pending_progress = (progress, status)
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        self.after(50, self._flush_progress)
+        
+    def _flush_progress(self):
+        """Apply the latest pending progress (called from main thread)"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_scheduled = False
+        if pending is not None and self.is_processing:
+            self._update_ui_progress(*pending)
             
     def _update_ui_progress(self, progress: float, status: str):
         """Update UI progress (called from main thread)"""
@@ -564,6 +775,7 @@ class SplitTab(ctk.CTkFrame):
     def _on_complete(self, total_clips: int):
         """Handle processing complete"""
         self.is_processing = False
+        self.file_picker.set_enabled(True)
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.progress_card.complete(success=True)
@@ -579,6 +791,7 @@ class SplitTab(ctk.CTkFrame):
     def _on_error(self, error: str):
         """Handle processing error"""
         self.is_processing = False
+        self.file_picker.set_enabled(True)
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.progress_card.complete(success=False)
@@ -590,8 +803,10 @@ class SplitTab(ctk.CTkFrame):
         
     def _stop_processing(self):
         """Stop video processing"""
+        self._cancel.set()
         self.is_processing = False
         self.progress_card.set_progress(0, "Stopped")
+        self.file_picker.set_enabled(True)
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         
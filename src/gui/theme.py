@@ -4,11 +4,19 @@ Professional dark theme with distinctive accent colors
 """
 
 import customtkinter as ctk
+import functools
+import sys
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Mapping
 
+# Theme values are read-only; slots (3.10+) make attribute reads skip the instance dict
+_THEME_DATACLASS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _THEME_DATACLASS["slots"] = True
 
-@dataclass
+
+@dataclass(**_THEME_DATACLASS)
 class ColorPalette:
     """Color palette for the application"""
     # Primary backgrounds
@@ -40,13 +48,9 @@ class ColorPalette:
     border_default: str = "#2a2a3c"     # Default borders
     border_hover: str = "#3a3a50"       # Hover borders
     border_focus: str = "#0066ff"       # Focus borders
-    
-    # Gradients (CSS-style)
-    gradient_primary: str = "linear-gradient(135deg, #0066ff 0%, #00d4ff 100%)"
-    gradient_dark: str = "linear-gradient(180deg, #1a1a2e 0%, #0d0d14 100%)"
 
 
-@dataclass 
+@dataclass(**_THEME_DATACLASS)
 class Typography:
     """Typography settings"""
     font_family: str = "SF Pro Display"
@@ -63,7 +67,7 @@ class Typography:
     size_4xl: int = 40
 
 
-@dataclass
+@dataclass(**_THEME_DATACLASS)
 class Spacing:
     """Spacing and sizing constants"""
     xs: int = 4
@@ -88,6 +92,44 @@ class Theme:
         self.colors = ColorPalette()
         self.typography = Typography()
         self.spacing = Spacing()
+        self._build_styles()
+        
+    def _build_styles(self):
+        """Precompute the widget style mappings once (the palette is frozen)"""
+        c = self.colors
+        radius = self.spacing.button_radius
+        
+        self._button_styles = {
+            variant: MappingProxyType({
+                "fg_color": fg,
+                "hover_color": hover,
+                "text_color": text,
+                "corner_radius": radius,
+            })
+            for variant, fg, hover, text in (
+                ("primary", c.accent_primary, c.accent_hover, c.text_primary),
+                ("secondary", c.bg_tertiary, c.bg_hover, c.text_primary),
+                ("ghost", "transparent", c.bg_tertiary, c.text_secondary),
+                ("danger", c.error, "#cc3a47", c.text_primary),
+                ("success", c.success, "#00b85e", c.text_primary),
+            )
+        }
+        self._input_style = MappingProxyType({
+            "fg_color": c.bg_tertiary,
+            "border_color": c.border_default,
+            "text_color": c.text_primary,
+            "placeholder_text_color": c.text_muted,
+            "corner_radius": self.spacing.input_radius,
+        })
+        self._card_style = MappingProxyType({
+            "fg_color": c.bg_secondary,
+            "corner_radius": self.spacing.card_radius,
+        })
+        # Indexed by active state
+        self._sidebar_button_styles = (
+            self._button_styles["ghost"],
+            self._button_styles["primary"],
+        )
         
     def apply_to_customtkinter(self):
         """Apply theme to CustomTkinter globally"""
@@ -96,100 +138,56 @@ class Theme:
         # Note: CustomTkinter doesn't support full custom themes
         # We'll apply colors directly to widgets
         
-    def get_button_style(self, variant: str = "primary") -> Dict:
-        """Get button styling based on variant"""
-        styles = {
-            "primary": {
-                "fg_color": self.colors.accent_primary,
-                "hover_color": self.colors.accent_hover,
-                "text_color": self.colors.text_primary,
-                "corner_radius": self.spacing.button_radius,
-            },
-            "secondary": {
-                "fg_color": self.colors.bg_tertiary,
-                "hover_color": self.colors.bg_hover,
-                "text_color": self.colors.text_primary,
-                "corner_radius": self.spacing.button_radius,
-            },
-            "ghost": {
-                "fg_color": "transparent",
-                "hover_color": self.colors.bg_tertiary,
-                "text_color": self.colors.text_secondary,
-                "corner_radius": self.spacing.button_radius,
-            },
-            "danger": {
-                "fg_color": self.colors.error,
-                "hover_color": "#cc3a47",
-                "text_color": self.colors.text_primary,
-                "corner_radius": self.spacing.button_radius,
-            },
-            "success": {
-                "fg_color": self.colors.success,
-                "hover_color": "#00b85e",
-                "text_color": self.colors.text_primary,
-                "corner_radius": self.spacing.button_radius,
-            }
-        }
-        return styles.get(variant, styles["primary"])
+    def get_button_style(self, variant: str = "primary") -> Mapping:
+        """Get button styling based on variant (shared read-only mapping)"""
+        return self._button_styles.get(variant, self._button_styles["primary"])
     
-    def get_input_style(self) -> Dict:
-        """Get input field styling"""
-        return {
-            "fg_color": self.colors.bg_tertiary,
-            "border_color": self.colors.border_default,
-            "text_color": self.colors.text_primary,
-            "placeholder_text_color": self.colors.text_muted,
-            "corner_radius": self.spacing.input_radius,
-        }
+    def get_input_style(self) -> Mapping:
+        """Get input field styling (shared read-only mapping)"""
+        return self._input_style
     
-    def get_card_style(self) -> Dict:
-        """Get card container styling"""
-        return {
-            "fg_color": self.colors.bg_secondary,
-            "corner_radius": self.spacing.card_radius,
-        }
+    def get_card_style(self) -> Mapping:
+        """Get card container styling (shared read-only mapping)"""
+        return self._card_style
     
-    def get_sidebar_button_style(self, active: bool = False) -> Dict:
-        """Get sidebar navigation button styling"""
-        if active:
-            return {
-                "fg_color": self.colors.accent_primary,
-                "hover_color": self.colors.accent_hover,
-                "text_color": self.colors.text_primary,
-                "corner_radius": self.spacing.button_radius,
-            }
-        return {
-            "fg_color": "transparent",
-            "hover_color": self.colors.bg_tertiary,
-            "text_color": self.colors.text_secondary,
-            "corner_radius": self.spacing.button_radius,
-        }
+    def get_sidebar_button_style(self, active: bool = False) -> Mapping:
+        """Get sidebar navigation button styling (shared read-only mapping)"""
+        return self._sidebar_button_styles[bool(active)]
 
 
 # Global theme instance
 theme = Theme()
 
 
+# Size names to point sizes, resolved once from the theme
+_FONT_SIZES = {
+    "xs": theme.typography.size_xs,
+    "sm": theme.typography.size_sm,
+    "md": theme.typography.size_md,
+    "lg": theme.typography.size_lg,
+    "xl": theme.typography.size_xl,
+    "2xl": theme.typography.size_2xl,
+    "3xl": theme.typography.size_3xl,
+    "4xl": theme.typography.size_4xl,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_font(family: str, size: int, weight: str) -> ctk.CTkFont:
+    """Create one shared CTkFont per resolved (family, size, weight)"""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
 def get_font(size: str = "md", weight: str = "normal", mono: bool = False) -> ctk.CTkFont:
-    """Get a font with specified properties"""
+    """Get a font with specified properties (shared instance per combination)"""
     t = theme.typography
     
-    size_map = {
-        "xs": t.size_xs,
-        "sm": t.size_sm,
-        "md": t.size_md,
-        "lg": t.size_lg,
-        "xl": t.size_xl,
-        "2xl": t.size_2xl,
-        "3xl": t.size_3xl,
-        "4xl": t.size_4xl,
-    }
-    
-    font_size = size_map.get(size, t.size_md)
+    font_size = _FONT_SIZES.get(size, t.size_md)
     font_family = t.font_family_mono if mono else t.font_family
     font_weight = "bold" if weight == "bold" else "normal"
     
-    return ctk.CTkFont(family=font_family, size=font_size, weight=font_weight)
+    # Keyed on resolved values, so keyword/positional calls and aliases share fonts
+    return _cached_font(font_family, font_size, font_weight)
 
 
 def apply_hover_effect(widget, normal_color: str, hover_color: str):
@@ -4,6 +4,7 @@ Helper modules and managers
 """
 
 from .preset_manager import PresetManager, Preset
+from .mousewheel import bind_mousewheel
 
-__all__ = ['PresetManager', 'Preset']
+__all__ = ['PresetManager', 'Preset', 'bind_mousewheel']
 
@@ -0,0 +1,38 @@
+"""
+LTW Video Editor Pro - Mouse Wheel
+Cross-platform wheel bindings for hand-rolled scroll areas
+"""
+
+import tkinter as tk
+from typing import Callable
+
+# Windows/macOS send <MouseWheel> with a delta; X11 sends Button-4 (up) / Button-5 (down)
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+def wheel_step(event) -> int:
+    """Scroll direction of a wheel event in units (-1 up, 1 down)"""
+    if event.num == 4:
+        return -1
+    if event.num == 5:
+        return 1
+    return -1 if event.delta > 0 else 1
+
+
+def bind_mousewheel(widget, on_scroll: Callable[[int], None]):
+    """
+    Call on_scroll(step) for wheel events over a widget and everything inside it
+
+    Bindings go on each Tk widget directly (not through CustomTkinter's bind,
+    which forwards to inner widgets that are visited here anyway), so every
+    wheel notch fires once. Call again for children added later.
+    """
+    def handler(event):
+        on_scroll(wheel_step(event))
+
+    pending = [widget]
+    while pending:
+        current = pending.pop()
+        for sequence in WHEEL_EVENTS:
+            tk.Misc.bind(current, sequence, handler, add="+")
+        pending.extend(current.winfo_children())
@@ -4,12 +4,24 @@ LTW Script-Guided Splitter
 Uses full AI-generated scripts to intelligently segment videos into logical sections.
 """
 
+import bisect
 import json
 import re
+import subprocess
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from video_splitter import VideoSplitter
 
+# All section markers in one pattern so a script is scanned once. Each marker
+# is a zero-width lookahead, so one kind never hides text from another; the
+# parser tracks where each kind's previous match ended to keep them from overlapping.
+_SECTION_RE = re.compile(
+    r'^(?=#+\s+(?P<header>.+)$)'
+    r'|^(?=(?P<num>\d+)\.\s+(?P<numbered>.+)$)'
+    r'|(?=\[(?P<minutes>\d{2}):(?P<seconds>\d{2})\]\s*(?P<timestamp>.+))',
+    re.MULTILINE
+)
+
 def parse_script_sections(script_path: Path) -> List[Dict]:
     """
     Parses a script file and identifies logical sections.
@@ -21,42 +33,106 @@ def parse_script_sections(script_path: Path) -> List[Dict]:
     with open(script_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    sections = []
-    
-    # Method 1: Markdown headers
-    header_pattern = r'^#+\s+(.+)$'
-    for match in re.finditer(header_pattern, content, re.MULTILINE):
-        section_name = match.group(1)
-        # Estimate position (rough, based on line number)
-        line_num = content[:match.start()].count('\n')
-        sections.append({
-            'name': section_name,
-            'estimated_time': line_num * 2,  # Rough estimate: 2 seconds per line
-            'type': 'header'
-        })
+    # Collected per kind, then concatenated in the original header/timestamp/numbered order
+    headers, timestamps, numbered = [], [], []
+    header_end = timestamp_end = numbered_end = 0
+    # Headers arrive in document order, so line numbers are counted incrementally
+    line_num = line_pos = 0
     
-    # Method 2: Timestamp markers [00:05] Section Name
-    timestamp_pattern = r'\[(\d{2}):(\d{2})\]\s*(.+)'
-    for match in re.finditer(timestamp_pattern, content):
-        minutes, seconds, section_name = match.groups()
-        time_seconds = int(minutes) * 60 + int(seconds)
-        sections.append({
-            'name': section_name.strip(),
-            'start_time': time_seconds,
-            'type': 'timestamp'
-        })
-    
-    # Method 3: Numbered sections
-    numbered_pattern = r'^(\d+)\.\s+(.+)$'
-    for match in re.finditer(numbered_pattern, content, re.MULTILINE):
-        num, section_name = match.groups()
-        sections.append({
-            'name': f"{num}. {section_name.strip()}",
-            'type': 'numbered'
-        })
+    for match in _SECTION_RE.finditer(content):
+        start = match.start()
+        if match.group('header') is not None:
+            if start < header_end:
+                continue
+            header_end = match.end('header')
+            # Method 1: Markdown headers
+            # Estimate position (rough, based on line number)
+            line_num += content.count('\n', line_pos, start)
+            line_pos = start
+            headers.append({
+                'name': match.group('header'),
+                'estimated_time': line_num * 2,  # Rough estimate: 2 seconds per line
+                'type': 'header'
+            })
+        elif match.group('timestamp') is not None:
+            if start < timestamp_end:
+                continue
+            timestamp_end = match.end('timestamp')
+            # Method 2: Timestamp markers [00:05] Section Name
+            time_seconds = int(match.group('minutes')) * 60 + int(match.group('seconds'))
+            timestamps.append({
+                'name': match.group('timestamp').strip(),
+                'start_time': time_seconds,
+                'type': 'timestamp'
+            })
+        else:
+            if start < numbered_end:
+                continue
+            numbered_end = match.end('numbered')
+            # Method 3: Numbered sections
+            numbered.append({
+                'name': f"{match.group('num')}. {match.group('numbered').strip()}",
+                'type': 'numbered'
+            })
     
+    sections = headers + timestamps + numbered
     return sections
 
+# A cut this close to a keyframe starts on that keyframe (about one frame at 50fps)
+KEYFRAME_TOLERANCE = 0.02
+
+def _keyframe_times(video_path: Path, start_offset: float) -> List[float]:
+    """
+    Lists the video's keyframe times in seconds from the start of the file.
+    """
+    probe = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0", "-skip_frame", "nokey",
+         "-show_entries", "frame=pts_time", "-of", "csv=p=0", str(video_path)],
+        capture_output=True, text=True
+    )
+    times = []
+    for line in probe.stdout.splitlines():
+        value = line.strip().rstrip(',')
+        if value and value != 'N/A':
+            times.append(float(value) - start_offset)
+    times.sort()
+    return times
+
+def _keyframe_at(keyframes: List[float], time: float) -> Optional[float]:
+    """
+    Returns the keyframe within KEYFRAME_TOLERANCE of a time, if there is one.
+    """
+    i = bisect.bisect_left(keyframes, time - KEYFRAME_TOLERANCE)
+    if i < len(keyframes) and keyframes[i] <= time + KEYFRAME_TOLERANCE:
+        return keyframes[i]
+    return None
+
+def _cut_clip(video_path: Path, start: float, end: float, output_path: Path,
+              keyframes: List[float]) -> bool:
+    """
+    Cuts one clip, stream-copying when it starts on a keyframe and re-encoding otherwise.
+    """
+    keyframe = _keyframe_at(keyframes, start)
+    if keyframe is not None:
+        # Seeking to the keyframe itself keeps the copy from starting at an earlier one
+        copy = subprocess.run(
+            ["ffmpeg", "-y", "-v", "error", "-ss", str(keyframe), "-to", str(end), "-i", str(video_path),
+             "-c", "copy", "-avoid_negative_ts", "make_zero", str(output_path)],
+            capture_output=True
+        )
+        if copy.returncode == 0 and output_path.exists() and output_path.stat().st_size > 0:
+            return True
+
+    # A copy from mid-GOP would start at the previous keyframe (overlapping the last
+    # clip) or with undecodable frames, so these clips are re-encoded at the exact cut
+    encode = subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", "-ss", str(start), "-to", str(end), "-i", str(video_path),
+         "-c:v", "libx264", "-preset", "fast", "-crf", "20",
+         "-c:a", "aac", "-b:a", "192k", str(output_path)],
+        capture_output=True
+    )
+    return encode.returncode == 0
+
 def create_script_guided_clips(video_path: Path, script_path: Path, output_dir: Path):
     """
     Creates clips based on script structure.
@@ -74,11 +150,14 @@ def create_script_guided_clips(video_path: Path, script_path: Path, output_dir:
     # For sections with timestamps, create clips directly
     # For others, we'll use the splitter with custom logic
     
-    # Load video to get duration
-    from moviepy import VideoFileClip
-    video = VideoFileClip(str(video_path))
-    duration = video.duration
-    video.close()
+    # Probe the duration (no need to open the whole video in MoviePy)
+    probe = subprocess.run(
+        ["ffprobe", "-v", "quiet", "-show_entries", "format=duration,start_time",
+         "-of", "json", str(video_path)],
+        capture_output=True, text=True, check=True
+    )
+    video_format = json.loads(probe.stdout).get('format', {})
+    duration = float(video_format['duration'])
     
     # Create clip times based on sections
     clip_times = []
@@ -96,11 +175,18 @@ def create_script_guided_clips(video_path: Path, script_path: Path, output_dir:
     
     if clip_times:
         print(f"🎬 Creating {len(clip_times)} script-guided clips...")
-        # Use VideoSplitter with custom clip times
-        splitter = VideoSplitter(output_dir=str(output_dir))
-        # We'd need to modify splitter to accept custom times, but for now:
-        print("   (Using script structure to guide clip creation)")
-        return len(clip_times)
+        # Clips starting on a keyframe are stream-copied; the rest are re-encoded
+        keyframes = _keyframe_times(video_path, float(video_format.get('start_time') or 0))
+        output_dir.mkdir(parents=True, exist_ok=True)
+        created = 0
+        for num, (start, end) in enumerate(clip_times, 1):
+            output_path = output_dir / f"{video_path.stem}_script_{num:03d}.mp4"
+            if _cut_clip(video_path, start, end, output_path, keyframes):
+                created += 1
+            else:
+                print(f"   ❌ Failed to create clip {num} ({start}s - {end}s)")
+        print(f"✅ Created {created} script-guided clips")
+        return created
     else:
         # Fallback
         splitter = VideoSplitter(output_dir=str(output_dir), clip_duration=30)